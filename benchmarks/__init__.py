@@ -0,0 +1,4 @@
+from .forge import Forge
+from .hoard import Hoard
+from .suite import Suite
+from .trial import Trial
@@ -0,0 +1,95 @@
+import argparse
+import json
+import logging
+import os
+from pathlib import Path
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide2 import QtGui
+import pandas as pd
+
+from benchmarks import Forge, Hoard, Suite
+from src.settings import PATHS
+
+
+def compare(results: dict, baseline_file: Path, threshold: float) -> bool:
+    baseline = json.loads(baseline_file.read_text())['trials']
+    regressed = False
+    for name, result in results['trials'].items():
+        if name not in baseline:
+            continue
+        ratio = result['median_ms'] / baseline[name]['median_ms'] if baseline[name]['median_ms'] else 1.
+        regressed |= ratio > threshold
+        logging.info(f'{name}: {ratio:.2f}x baseline median' + (' (regression)' if ratio > threshold else ''))
+    return not regressed
+
+
+def get_revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def main(args: argparse.Namespace) -> int:
+    _ = QtGui.QGuiApplication.instance() or QtGui.QGuiApplication(sys.argv[:1])
+    forge = Forge(guards=args.guards, traits=args.traits, treasures=args.treasures, books=args.books,
+                  pages=args.pages)
+    with tempfile.TemporaryDirectory() as directory:
+        PATHS['keeps'] = Path(directory)
+        start = time.perf_counter()
+        keep = forge.forge()
+        forge_seconds = time.perf_counter() - start
+        hoard = Hoard()
+        hoard.start()
+        try:
+            trials = Suite(keep, repeat=args.repeat, seed=args.seed, hoard=hoard,
+                           download_size=args.download_size).run()
+        finally:
+            hoard.stop()
+        keep.close()
+    results = dict(
+        created=time.strftime('%Y-%m-%d %H:%M:%S'),
+        revision=get_revision(),
+        python=platform.python_version(),
+        pandas=pd.__version__,
+        scale=forge.scale | {'download_size': args.download_size},
+        repeat=args.repeat,
+        forge_s=forge_seconds,
+        trials=trials
+    )
+    text = json.dumps(results, indent=2)
+    if args.output == '-':
+        print(text)
+    else:
+        Path(args.output).write_text(text)
+    if args.compare:
+        return 0 if compare(results, Path(args.compare), args.threshold) else 1
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Benchmark the Lorekeeper model layer.')
+    parser.add_argument('--guards', type=int, default=10000)
+    parser.add_argument('--traits', type=int, default=60000)
+    parser.add_argument('--treasures', type=int, default=5000)
+    parser.add_argument('--books', type=int, default=2000)
+    parser.add_argument('--pages', type=int, default=20, help='pages per book')
+    parser.add_argument('--download-size', type=int, default=1 << 20, help='bytes per served download')
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='-', help='JSON result file, - for stdout')
+    parser.add_argument('--compare', help='JSON result file of a previous run')
+    parser.add_argument('--threshold', type=float, default=1.2, help='median ratio counted as a regression')
+    return parser.parse_args()
+
+
+logging.basicConfig(level=logging.INFO)
+sys.exit(main(parse_args()))
@@ -0,0 +1,66 @@
+import logging
+import time
+
+from src.model import Book, Building, Guard, Keep, Page, Trait, Treasure
+
+
+class Forge:
+
+    def __init__(self, guards: int = 10000, traits: int = 60000, treasures: int = 5000, books: int = 2000,
+                 pages: int = 20):
+        self.guards = guards
+        self.traits = traits
+        self.treasures = treasures
+        self.books = books
+        self.pages = pages
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def forge(self, ruleset: str = 'dnd') -> Keep:
+        start = time.perf_counter()
+        keep = Keep.new(ruleset)
+        keep.buildings['guard'] = Building(keep, Guard)
+        keep.buildings['guard'].create_table()
+        with keep.batch():
+            treasure_indices = [self.forge_treasure(keep, n) for n in range(self.treasures)]
+            guard_indices = self.forge_guards(keep, treasure_indices)
+            self.forge_traits(keep, guard_indices)
+            self.forge_books(keep, treasure_indices)
+        keep.save_config()
+        keep.scribe.drain()
+        self.logger.info(f'Forged {keep.uuid} in {time.perf_counter() - start:.1f} s')
+        return keep
+
+    def forge_books(self, keep: Keep, treasure_indices: list[int]):
+        for n, db_index in enumerate(keep.buildings['book'].reserve(self.books)):
+            book = Book(keep, db_index=db_index, data={'name': f'Book {n}', 'text': f'<p>Book {n}</p>',
+                                                       '_treasure': self.pick(treasure_indices, n)})
+            book.commit()
+            for list_index in range(self.pages):
+                Page(keep, data={'_book': db_index, 'list_index': list_index, 'name': f'Page {list_index}',
+                                 'text': f'<p>Page {list_index} of book {n}</p>'}).commit()
+
+    def forge_guards(self, keep: Keep, treasure_indices: list[int]) -> list[int]:
+        guard_indices = list(keep.buildings['guard'].reserve(self.guards))
+        for n, db_index in enumerate(guard_indices):
+            Guard(keep, db_index=db_index, data={'name': f'Guard {n}', 'type': 'beast',
+                                                 '_treasure': self.pick(treasure_indices, n)}).commit()
+        return guard_indices
+
+    def forge_traits(self, keep: Keep, guard_indices: list[int]):
+        for n in range(self.traits if guard_indices else 0):
+            Trait(keep, data={'_guard': guard_indices[n % len(guard_indices)], 'name': f'trait {n % 50}'}).commit()
+
+    @staticmethod
+    def forge_treasure(keep: Keep, n: int) -> int:
+        treasure = Treasure(keep, data={'name': f'Treasure {n}', 'suffix': '.txt', 'type': 'text'})
+        treasure.set_bytes(f'Treasure {n}'.encode())
+        return treasure.commit()
+
+    @staticmethod
+    def pick(indices: list[int], n: int) -> int:
+        return indices[n % len(indices)] if indices else 0
+
+    @property
+    def scale(self) -> dict[str, int]:
+        return {'guards': self.guards, 'traits': self.traits, 'treasures': self.treasures, 'books': self.books,
+                'pages': self.pages}
@@ -0,0 +1,81 @@
+from collections import Counter
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import logging
+import random
+import threading
+import time
+
+
+class HoardHandler(BaseHTTPRequestHandler):
+    BLOCK_SIZE = 1 << 16
+    protocol_version = 'HTTP/1.1'
+    server: 'Hoard'
+
+    def do_GET(self):
+        match self.path.strip('/').split('/'):
+            case ['payload', name]:
+                self.send_payload(self.get_size(name))
+            case ['flaky', token, failures, name]:
+                self.server.attempts[token] += 1
+                if self.server.attempts[token] <= int(failures):
+                    self.send_error(503)
+                else:
+                    self.send_payload(self.get_size(name))
+            case ['stall', seconds, name]:
+                time.sleep(float(seconds))
+                self.send_payload(self.get_size(name))
+            case ['unsized', name]:
+                self.send_payload(self.get_size(name), sized=False)
+            case _:
+                self.send_error(404)
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def get_block(size: int) -> bytes:
+        return random.Random(size).randbytes(min(size, HoardHandler.BLOCK_SIZE))
+
+    @staticmethod
+    def get_size(name: str) -> int:
+        return int(name.split('.', 1)[0])
+
+    def log_message(self, format_: str, *args):
+        self.server.logger.debug(format_ % args)
+
+    def send_payload(self, size: int, sized: bool = True):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        if sized:
+            self.send_header('Content-Length', str(size))
+        else:
+            self.send_header('Connection', 'close')
+            self.close_connection = True
+        self.end_headers()
+        block = self.get_block(size)
+        for start in range(0, size, len(block) or 1):
+            self.wfile.write(block[:size - start])
+
+
+class Hoard(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0):
+        super().__init__((host, port), HoardHandler)
+        self.attempts: Counter[str] = Counter()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.thread = threading.Thread(target=self.serve_forever, name='Hoard', daemon=True)
+
+    def get_url(self, *parts: str | int) -> str:
+        return f'http://{self.server_address[0]}:{self.server_address[1]}/' + '/'.join(map(str, parts))
+
+    def handle_error(self, request, client_address: tuple[str, int]):
+        self.logger.debug(f'Request from {client_address[0]}:{client_address[1]} failed', exc_info=True)
+
+    def start(self):
+        self.thread.start()
+        self.logger.info(f'Serving on {self.get_url()}')
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        self.thread.join()
@@ -0,0 +1,125 @@
+import itertools
+import random
+
+import requests
+
+from .hoard import Hoard
+from .trial import Trial
+from src.model import Book, Building, Guard, Keep, Trait, Treasure
+from src.model.courier import Courier
+from src.settings import PATHS
+
+
+class Suite:
+
+    def __init__(self, keep: Keep, repeat: int = 20, seed: int = 0, hoard: Hoard | None = None,
+                 download_size: int = 1 << 20, stall_timeout: float = .25):
+        self.keep = keep
+        self.hoard = hoard
+        self.download_size = download_size
+        self.stall_courier = Courier(retries=0, timeout=(Courier.TIMEOUT[0], stall_timeout))
+        self.stall_timeout = stall_timeout
+        self.tokens = itertools.count()
+        self.repeat = repeat
+        self.random = random.Random(seed)
+        self.guard_indices = keep.buildings['guard'].df.index.tolist()
+
+    def get_trials(self) -> list[Trial]:
+        trials = [
+            Trial('keep.read_config', self.open_keep, repeat=self.repeat),
+            Trial('feature.commit.insert', lambda trait: trait.commit(), self.new_trait, repeat=self.repeat),
+            Trial('feature.commit.update', lambda guard: guard.commit(), self.read_guard, repeat=self.repeat),
+            Trial('guard.get_tags', lambda guard: guard.get_tags(), self.read_guard, repeat=self.repeat),
+            Trial('guard.read_keep', self.read_guard, repeat=self.repeat, number=100),
+            Trial('building.read_many', lambda building: building.read_many(), lambda: self.keep.buildings['guard'],
+                  repeat=self.repeat),
+            Trial('building.save', self.save_guards, self.modify_guards, repeat=self.repeat),
+        ]
+        if len(self.keep.buildings['book'].df.index) > self.repeat:
+            trials.append(Trial('keep.delete.book', self.delete, self.pick_book, repeat=self.repeat))
+        if len(self.keep.buildings['treasure'].df.index) > self.repeat:
+            trials.append(Trial('keep.delete.treasure', self.delete, self.pick_treasure, repeat=self.repeat))
+        if self.hoard:
+            trials.extend([
+                Trial('treasure.read_url', self.read_url, lambda: self.hoard.get_url('payload', self.image_name),
+                      repeat=self.repeat),
+                Trial('treasure.read_url.retry', self.read_url, self.get_flaky_url, repeat=self.repeat),
+                Trial('treasure.read_url.oversize', self.expect_failure,
+                      lambda: self.hoard.get_url('payload', f'{self.keep.courier.max_size + 1}.png'),
+                      repeat=self.repeat),
+                Trial('treasure.read_url.oversize_unsized', self.expect_failure,
+                      lambda: self.hoard.get_url('unsized', f'{self.keep.courier.max_size + 1}.png'),
+                      repeat=self.repeat),
+                Trial('treasure.read_url.stall', self.read_stalled_url,
+                      lambda: self.hoard.get_url('stall', self.stall_timeout * 2, self.image_name),
+                      repeat=self.repeat),
+            ])
+        return trials
+
+    def delete(self, feature: Book | Treasure):
+        feature.delete()
+        self.keep.scribe.drain()
+
+    def expect_failure(self, url: str):
+        before = set(PATHS['workbench'].iterdir())
+        try:
+            self.read_url(url)
+        except (requests.RequestException, ValueError):
+            pass
+        else:
+            raise RuntimeError(f'{url} did not fail.')
+        if leftovers := set(PATHS['workbench'].iterdir()) - before:
+            raise RuntimeError(f'{url} left {sorted(path.name for path in leftovers)} in the workbench.')
+
+    def get_flaky_url(self) -> str:
+        return self.hoard.get_url('flaky', next(self.tokens), 1, self.image_name)
+
+    @property
+    def image_name(self) -> str:
+        return f'{self.download_size}.png'
+
+    def modify_guards(self):
+        for guard in (self.read_guard() for _ in range(100)):
+            guard['name'] += '*'
+            guard.commit()
+
+    def new_trait(self) -> Trait:
+        return Trait(self.keep, data={'_guard': self.read_guard().db_index, 'name': 'benchmark'})
+
+    def open_keep(self, _):
+        keep = Keep.read_config(PATHS['keeps'].joinpath(self.keep.uuid + '.json'))
+        keep.buildings['guard'] = Building.read_keep(keep, Guard)
+        for building in keep.buildings.values():
+            _ = building.df
+        keep.close()
+
+    def pick_book(self) -> Book:
+        return Book.read_keep(self.keep, self.random.choice(self.keep.buildings['book'].df.index.tolist()))
+
+    def pick_treasure(self) -> Treasure:
+        return Treasure.read_keep(self.keep, self.random.choice(self.keep.buildings['treasure'].df.index.tolist()))
+
+    def read_guard(self, _=None) -> Guard:
+        guard_type = self.keep.buildings['guard'].feature_type
+        return guard_type.read_keep(self.keep, self.random.choice(self.guard_indices))
+
+    def read_stalled_url(self, url: str):
+        courier = self.keep.courier
+        self.keep.courier = self.stall_courier
+        try:
+            self.expect_failure(url)
+        finally:
+            self.keep.courier = courier
+
+    def read_url(self, url: str) -> Treasure:
+        return Treasure.read_url(self.keep, url, silent=False)
+
+    def run(self) -> dict[str, dict[str, float | int]]:
+        try:
+            return {trial.name: trial.run() for trial in self.get_trials()}
+        finally:
+            self.stall_courier.close()
+
+    def save_guards(self, _):
+        self.keep.buildings['guard'].save()
+        self.keep.scribe.drain()
@@ -0,0 +1,42 @@
+import logging
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable
+
+
+class Trial:
+
+    def __init__(self, name: str, func: Callable[[Any], Any], setup: Callable[[], Any] = None, repeat: int = 20,
+                 number: int = 1):
+        self.name = name
+        self.func = func
+        self.setup = setup or (lambda: None)
+        self.repeat = repeat
+        self.number = number
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def measure(self) -> float:
+        argument = self.setup()
+        start = time.perf_counter()
+        for _ in range(self.number):
+            self.func(argument)
+        return (time.perf_counter() - start) / self.number
+
+    def measure_memory(self) -> int:
+        argument = self.setup()
+        tracemalloc.start()
+        try:
+            self.func(argument)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def run(self) -> dict[str, float | int]:
+        timings = sorted(self.measure() for _ in range(self.repeat))
+        p95 = statistics.quantiles(timings, n=20, method='inclusive')[-1] if len(timings) > 1 else timings[0]
+        result = {'runs': len(timings), 'number': self.number, 'median_ms': statistics.median(timings) * 1000,
+                  'p95_ms': p95 * 1000, 'peak_kib': self.measure_memory() / 1024}
+        self.logger.info(f'{self.name}: median {result["median_ms"]:.2f} ms, p95 {result["p95_ms"]:.2f} ms, '
+                         f'peak {result["peak_kib"]:.0f} KiB')
+        return result
@@ -342,17 +342,13 @@ class EncounterInspector(QtWidgets.QMainWindow):
 
     def delete_banners(self):
         banner = self.keep.buildings['banner']
-        df = banner.df
-        df.drop(df[df['_encounter'] == self.encounter.db_index].index, inplace=True)
-        banner.reset_columns()
-        banner.save(False)
+        banner.drop_where('_encounter', self.encounter.db_index)
+        banner.save()
 
     def delete_combatants(self):
         combatant = self.keep.buildings['combatant']
-        df = combatant.df
-        df.drop(df[df['_encounter'] == self.encounter.db_index].index, inplace=True)
-        combatant.reset_columns()
-        combatant.save(False)
+        combatant.drop_where('_encounter', self.encounter.db_index)
+        combatant.save()
 
     def delete_encounter(self):
         if DeleteDialog('Encounter', self).get() == 'cancel':
@@ -435,9 +431,8 @@ class EncounterInspector(QtWidgets.QMainWindow):
         vertical_header.setMinimumWidth(40)
         vertical_header.setDefaultAlignment(QtCore.Qt.AlignCenter)
         self.table.setHorizontalHeaderLabels(list(header[1] for header in self.HEADER))
-        combatant = self.keep.buildings['combatant'].df
         try:
-            data = combatant[combatant['_encounter'] == self.encounter.db_index].copy()
+            data = self.encounter.get_combatant_frame().copy()
 
             def add_series(series: pd.Series):
                 self.add_row(**{key: series.get(key) for key, _ in self.HEADER})
@@ -743,7 +738,7 @@ class EncounterInspector(QtWidgets.QMainWindow):
         db_index = self.encounter.db_index
         for tag_name in self.tag_frame.tags:
             Banner(keep, data={'_encounter': db_index, 'name': tag_name}).commit()
-        keep.buildings['banner'].save(False)
+        keep.buildings['banner'].save()
 
     def save_combatants(self):
         self.delete_combatants()
@@ -753,7 +748,7 @@ class EncounterInspector(QtWidgets.QMainWindow):
             data = self.get_dict(row)
             data['_encounter'] = db_index
             Combatant(keep, data=data).commit()
-        keep.buildings['combatant'].save(False)
+        keep.buildings['combatant'].save()
 
     def set_modified(self, value: bool = True):
         self.is_modified = value
@@ -30,9 +30,7 @@ class Enlistment(BuildingWindow):
         self.table.SEARCH.connect(self.toolbar.search)
         self.set_settings(settings)
         SIGNALS.ENCOUNTER_COMMIT.connect(lambda _: keep.buildings['encounter'].save())
-        SIGNALS.ENCOUNTER_DELETE.connect(self.on_encounter_delete)
         SIGNALS.ENCOUNTER_INSPECT.connect(self.on_encounter_inspect)
-        SIGNALS.GUARD_DELETE.connect(self.on_guard_delete)
 
     def contextMenuEvent(self, event: QtGui.QContextMenuEvent):
         menu = QtWidgets.QMenu(self)
@@ -56,20 +54,6 @@ class Enlistment(BuildingWindow):
         if DeleteDialog('encounter').get() == 'delete':
             Encounter.read_keep(self.keep, db_index=db_index).delete()
 
-    def on_guard_delete(self, db_index: int):
-        building = self.keep.buildings['combatant']
-        building.df.loc[building.df['_guard'] == db_index, '_guard'] = 0
-        building.save(False)
-
-    def on_encounter_delete(self, db_index: int):
-        for building_name in ('banner', 'sigil', 'combatant'):
-            building = self.keep.buildings[building_name]
-            df = building.df
-            df.drop(df[df['_encounter'] == db_index].index, inplace=True)
-            building.reset_columns()
-            building.save(modified_only=False)
-        self.keep.buildings['encounter'].save()
-
     def on_encounter_inspect(self, db_index: int):
         for child in QtWidgets.QApplication.topLevelWidgets():
             if not isinstance(child, EncounterInspector):
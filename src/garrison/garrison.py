@@ -31,8 +31,7 @@ class Garrison(BuildingWindow):
         self.toolbar.STRING.connect(self.table.toolbar_set_search)
         self.table.SEARCH.connect(self.toolbar.search)
         self.set_settings(settings)
-        SIGNALS.GUARD_COMMIT.connect(lambda _: keep.buildings['guard'].save(False))
-        SIGNALS.GUARD_DELETE.connect(self.on_delete_guard)
+        SIGNALS.GUARD_COMMIT.connect(lambda _: keep.buildings['guard'].save())
         SIGNALS.GUARD_INSPECT.connect(self.on_inspect_guard)
         SIGNALS.GUARD_POPUP.connect(self.on_guard_popup)
 
@@ -78,15 +77,6 @@ class Garrison(BuildingWindow):
         if DeleteDialog('guard').get() == 'delete':
             RULESET.GUARD_TYPE.read_keep(self.keep, db_index=db_index).delete()
 
-    def on_delete_guard(self, db_index):
-        for building_name in ('trait', 'combatant'):
-            building = self.keep.buildings[building_name]
-            df = building.df
-            df.drop(df[df['_guard'] == db_index].index, inplace=True)
-            building.reset_columns()
-            building.save(modified_only=False)
-        self.keep.buildings['guard'].save()
-
     def on_guard_popup(self, db_index: int):
         for child in QtWidgets.QApplication.topLevelWidgets():
             if not isinstance(child, GuardPopup):
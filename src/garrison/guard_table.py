@@ -1,10 +1,9 @@
 from collections import defaultdict
 import re
 
-import pandas as pd
 from PySide2 import QtCore, QtWidgets
 
-from src.model import Keep
+from src.model import Feature, Keep
 from src.rulesets import RULESET
 from src.widgets import BuildingTable
 
@@ -17,26 +16,22 @@ class GuardTable(BuildingTable):
         super().__init__(keep=keep, feature_type=RULESET.GUARD_TYPE, parent=parent)
         self.row_num = None
         self.display_type: dict[str, bool] = defaultdict(lambda: True)
-        self.df = self.keep.buildings['guard'].df
-        self.trait_df = self.keep.buildings['trait'].df
         self.search_white_list: tuple[str, ...] = ()
         self.search_black_list: tuple[str, ...] = ()
         self.trait_index = 0
         self.type_index = 0
         self.name_index = 0
 
-        self.reload_data()
-        self.refresh_hidden()
+        self.reload_header()
 
-    def load_series(self, series: pd.Series, row: int | None = None):
+    def load_feature(self, feature: Feature, row: int | None = None):
         self.blockSignals(True)
         new_row = row is None
         if new_row:
             row = self.row_num
-        series = series.copy(False)
-        db_index = int(series.name)  # noqa
+        db_index = feature.db_index
         for column, (key, value) in enumerate(RULESET.GARRISON_HEADER):
-            item = QtWidgets.QTableWidgetItem(REGEX_REMOVE_HTML.sub('', str(series.get(key, ''))))
+            item = QtWidgets.QTableWidgetItem(REGEX_REMOVE_HTML.sub('', feature.get_text(key)))
             item.setData(QtCore.Qt.UserRole, db_index)
             item.setFlags(item.flags() & ~QtCore.Qt.ItemIsEditable)
             self.setItem(row, column, item)
@@ -57,6 +52,15 @@ class GuardTable(BuildingTable):
         self.clear()
         self.setRowCount(len(self.df.index))
         self.row_num = 0
+        self.reload_header()
+        for feature in self.building.read_many():
+            self.load_feature(feature)
+        self.verticalHeader().setVisible(False)
+        self.horizontalHeader().setMinimumSectionSize(20)
+        self.resizeColumnsToContents()
+        self.resizeRowsToContents()
+
+    def reload_header(self):
         index = 0
         for index, (key, name) in enumerate(RULESET.GARRISON_HEADER):
             if key == 'traits':
@@ -67,12 +71,6 @@ class GuardTable(BuildingTable):
                 self.type_index = index
         self.setColumnCount(index + 1)
         self.setHorizontalHeaderLabels([name for column, name in RULESET.GARRISON_HEADER])
-        if not self.df.empty:
-            self.df.apply(self.load_series, axis=1)
-        self.verticalHeader().setVisible(False)
-        self.horizontalHeader().setMinimumSectionSize(20)
-        self.resizeColumnsToContents()
-        self.resizeRowsToContents()
 
     def toolbar_set_type(self, value: bool, type_: str):
         self.display_type[type_] = value
@@ -1,4 +1,3 @@
-import pandas as pd
 from pathlib import Path
 from PySide2 import QtCore, QtGui, QtWidgets
 
@@ -118,10 +117,8 @@ class BookInspector(QtWidgets.QMainWindow):
 
     def delete_keywords(self):
         keyword = self.book.keep.buildings['keyword']
-        df = keyword.df
-        df.drop(df[df['_book'] == self.book.db_index].index, inplace=True)
-        keyword.reset_columns()
-        keyword.save(False)
+        keyword.drop_where('_book', self.book.db_index)
+        keyword.save()
 
     def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
         if watched == self.page_list:
@@ -151,16 +148,12 @@ class BookInspector(QtWidgets.QMainWindow):
             self.close()
 
     def load_pages(self):
-        df = self.keep.buildings['page'].df
-        df = df[df['_book'] == self.db_index].sort_values(by='list_index')
-
-        def _new_page(series: pd.Series):
-            page = Page.read_keep(self.keep, int(series.name))  # noqa
+        page_building = self.keep.buildings['page']
+        for page in page_building.read_many(page_building.get_ordered_index('_book', self.db_index, 'list_index')):
             tab = PageTab(self.book, page)
             tab.MODIFIED.connect(self.set_modified)
             tab.DELETE.connect(self.on_tab_delete)
             self.page_list.addTab(tab, page['name'])
-        df.apply(_new_page, axis=1)
 
     def new_page(self):
         page = Page.new(self.keep)
@@ -281,7 +274,7 @@ class BookInspector(QtWidgets.QMainWindow):
         db_index = self.book.db_index
         for tag_name in self.tag_frame.tags:
             Keyword(keep, data={'_book': db_index, 'name': tag_name}).commit()
-        keep.buildings['keyword'].save(False)
+        keep.buildings['keyword'].save()
 
     def save_pages(self):
         for row in range(self.page_list.tabBar().count()):
@@ -1,9 +1,8 @@
 from collections import defaultdict
 
-import pandas as pd
 from PySide2 import QtCore, QtGui, QtWidgets
 
-from src.model import Book, Keep
+from src.model import Book, Feature, Keep
 from src.settings import SIGNALS
 from src.widgets import BuildingTable, Icon
 
@@ -14,12 +13,10 @@ class BookTable(BuildingTable):
     def __init__(self, keep: Keep, parent: QtWidgets.QWidget | None = None):
         super().__init__(keep=keep, feature_type=Book, parent=parent)
         self.display_type: dict[str, bool] = defaultdict(lambda: True)
-        self.keyword_df = keep.buildings['keyword'].df
         self.search_black_list: tuple[str, ...] = ()
         self.search_white_list: tuple[str, ...] = ()
         self.row_num = None
-        self.reload_data()
-        self.refresh_hidden()
+        self.reload_header()
 
     def eventFilter(self, source: QtCore.QObject, event: QtCore.QEvent) -> bool:
         if event.type() == QtCore.QEvent.MouseMove and source in (QtWidgets.QToolButton,):
@@ -28,21 +25,20 @@ class BookTable(BuildingTable):
             return True
         return super().eventFilter(source, event)
 
-    def load_series(self, series: pd.Series, row: int | None = None):
+    def load_feature(self, feature: Feature, row: int | None = None):
         self.blockSignals(True)
         new_row = row is None
         if new_row:
             row = self.row_num
-        series = series.copy(False)
-        db_index = int(series.name)  # noqa
-        name_item = QtWidgets.QTableWidgetItem(series['name'])
+        db_index = feature.db_index
+        name_item = QtWidgets.QTableWidgetItem(feature['name'])
         name_item.setData(QtCore.Qt.UserRole, db_index)
         name_item.setFlags(name_item.flags() & ~QtCore.Qt.ItemIsEditable)
         type_item = QtWidgets.QWidget()
         type_layout = QtWidgets.QHBoxLayout()
         type_icon = QtWidgets.QToolButton()
-        type_icon.setIcon(Icon(series['type']))
-        type_item.type_name = series['type']
+        type_icon.setIcon(Icon(feature['type']))
+        type_item.type_name = feature['type']
         type_icon.setIconSize(QtCore.QSize(22, 22))
         type_icon.setAutoRaise(True)
         type_icon.clicked.connect(lambda: SIGNALS.BOOK_INSPECT.emit(db_index))
@@ -55,15 +51,15 @@ class BookTable(BuildingTable):
         type_layout.setContentsMargins(0, 0, 0, 0)
         type_item.setLayout(type_layout)
         created_item = QtWidgets.QTableWidgetItem()
-        created_item.setText(series['_created'])
+        created_item.setText(feature.get_text('_created'))
         created_item.setFlags(created_item.flags() & ~QtCore.Qt.ItemIsEditable)
         created_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
         modified_item = QtWidgets.QTableWidgetItem()
-        modified_item.setText(series['_modified'])
+        modified_item.setText(feature.get_text('_modified'))
         modified_item.setFlags(modified_item.flags() & ~QtCore.Qt.ItemIsEditable)
         modified_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
         keywords_item = QtWidgets.QTableWidgetItem()
-        keywords_item.setText(series['keywords'])
+        keywords_item.setText(feature['keywords'])
         keywords_item.setFlags(keywords_item.flags() & ~QtCore.Qt.ItemIsEditable)
         keywords_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
 
@@ -88,15 +84,18 @@ class BookTable(BuildingTable):
         self.clear()
         self.setRowCount(len(self.df.index))
         self.row_num = 0
-        self.setColumnCount(5)
-        self.setHorizontalHeaderLabels(['Name', 'Type', 'Created', 'Last Modified', 'Keywords'])
-        if not self.df.empty:
-            self.df.apply(self.load_series, axis=1)
+        self.reload_header()
+        for feature in self.building.read_many():
+            self.load_feature(feature)
         self.verticalHeader().setVisible(False)
         self.horizontalHeader().setMinimumSectionSize(20)
         self.resizeColumnsToContents()
         self.resizeRowsToContents()
 
+    def reload_header(self):
+        self.setColumnCount(5)
+        self.setHorizontalHeaderLabels(['Name', 'Type', 'Created', 'Last Modified', 'Keywords'])
+
     def toolbar_set_type(self, value: bool, type_: str):
         self.display_type[type_] = value
         self.refresh_hidden()
@@ -1,4 +1,3 @@
-import pandas as pd
 from PySide2 import QtCore, QtGui, QtWidgets
 
 from .book_inspector import BookInspector
@@ -35,8 +34,6 @@ class Library(BuildingWindow):
         self.set_settings(settings)
         SIGNALS.BOOK_INSPECT.connect(self.on_inspect_book)
         SIGNALS.BOOK_COMMIT.connect(lambda _: self.save_book())
-        SIGNALS.BOOK_DELETE.connect(self.on_book_delete)
-        SIGNALS.PAGE_DELETE.connect(self.on_page_delete)
 
     def contextMenuEvent(self, event: QtGui.QContextMenuEvent):
         menu = QtWidgets.QMenu(self)
@@ -64,40 +61,10 @@ class Library(BuildingWindow):
         return {'hidden': tuple(self.book_table.isColumnHidden(column)
                                 for column in range(self.book_table.columnCount()))}
 
-    def on_book_delete(self, db_index: int):
-        for building_name in ('keyword', 'footnote'):
-            building = self.keep.buildings[building_name]
-            building.df.drop(building.df[building.df['_book'] == db_index].index, inplace=True)
-            building.reset_columns()
-            building.save(False)
-
-        page = self.keep.buildings['page']
-        page_df = page.df[page.df['_book'] == db_index]
-
-        def delete_page(series: pd.Series):
-            self.on_page_delete(int(series.name))  # noqa
-        page_df.apply(delete_page, axis=1)
-        page.df.drop(page_df.index, inplace=True)
-        page.reset_columns()
-        page.save(False)
-
-        self.keep.buildings['book'].save(False)
-
     def on_delete(self, db_index: int):
         if DeleteDialog('book').get() == 'delete':
             Book.read_keep(self.keep, db_index=db_index).delete()
 
-    def on_page_delete(self, db_index: int):
-        for building_name in ('chart', 'footnote', 'sigil'):
-            building = self.keep.buildings[building_name]
-            df = building.df
-            df.drop(df[df['_page'] == db_index].index, inplace=True)
-            building.reset_columns()
-            building.save(False)
-        page = self.keep.buildings['page']
-        page.reset_columns()
-        page.save(False)
-
     def on_inspect_book(self, db_index: int):
         for child in QtWidgets.QApplication.topLevelWidgets():
             if not isinstance(child, BookInspector):
@@ -111,13 +78,8 @@ class Library(BuildingWindow):
         inspector.show()
 
     def save_book(self):
-        self.keep.buildings['book'].save()
-        self.keep.buildings['keyword'].save(False)
-        self.keep.buildings['page'].save(False)
-        self.keep.buildings['chart'].save(False)
-        self.keep.buildings['footnote'].save(False)
-        self.keep.buildings['performance'].save(False)
-        self.keep.buildings['sigil'].save(False)
+        for building_name in ('book', 'keyword', 'page', 'chart', 'footnote', 'performance', 'sigil'):
+            self.keep.buildings[building_name].save()
 
     def set_settings(self, settings: dict):
         if not settings:
@@ -1,4 +1,3 @@
-import pandas as pd
 from PySide2 import QtCore, QtGui, QtWidgets
 
 from src.model import Book, Encounter, Feature, Keep, Minstrel, Treasure
@@ -124,10 +123,7 @@ class ReferenceFrame(QtWidgets.QWidget):
 
     def delete_references(self):
         for building_name in ('chart', 'footnote', 'performance', 'sigil'):
-            building = self.keep.buildings[building_name]
-            df = building.df
-            df.drop(df[df['_page'] == self.db_index].index, inplace=True)
-            building.reset_columns()
+            self.keep.buildings[building_name].drop_where('_page', self.db_index)
 
     def dragEnterEvent(self, event: QtGui.QDragEnterEvent):
         if event.source() == self.list:
@@ -210,25 +206,21 @@ class ReferenceFrame(QtWidgets.QWidget):
             self.feature_preview = None
 
     def load_references(self):
-        def to_reference(table_name, feature_name) -> pd.DataFrame:
-            df = self.keep.buildings[table_name].df
-            df = df[df['_page'] == self.db_index].copy()
-            df['table_name'] = feature_name
-            df.rename(columns={f'_{feature_name}': '_reference_index'}, inplace=True)
-            return df
-
-        def add_reference(series: pd.Series):
-            feature_type = self.keep.buildings[series['table_name']].feature_type
-            self.add_feature(feature_type.read_keep(self.keep, series['_reference_index']))
-
-        reference_list = list(reference for table_name, feature_name in (('footnote', 'book'),
-                                                                         ('performance', 'minstrel'),
-                                                                         ('sigil', 'encounter'),
-                                                                         ('chart', 'treasure'))
-                              if not (reference := to_reference(table_name, feature_name)).empty)
-        if reference_list:
-            reference_df = pd.concat(reference_list).sort_values(by='list_index')
-            reference_df.apply(add_reference, axis=1)
+        references = []
+        for table_name, feature_name in (('footnote', 'book'), ('performance', 'minstrel'), ('sigil', 'encounter'),
+                                         ('chart', 'treasure')):
+            building = self.keep.buildings[table_name]
+            references.extend((building.get_value(db_index, 'list_index'), feature_name,
+                               building.get_value(db_index, f'_{feature_name}'))
+                              for db_index in building.get_ordered_index('_page', self.db_index, 'list_index'))
+        references.sort()
+        features = {}
+        for feature_name in {feature_name for _, feature_name, _ in references}:
+            index = [reference_index for _, name, reference_index in references if name == feature_name]
+            features.update(((feature_name, feature.db_index), feature)
+                            for feature in self.keep.buildings[feature_name].read_many(index))
+        for _, feature_name, reference_index in references:
+            self.add_feature(features[feature_name, reference_index])
 
     def mouseMoveEvent(self, event: QtGui.QMouseEvent):
         try:
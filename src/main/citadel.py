@@ -27,10 +27,11 @@ class Citadel(QtWidgets.QMainWindow):
         self.setStyleSheet('*{font-family: Roboto Slab;font-size: 10pt;};')
 
         self._is_modified = False
+        self._save_state = 'flushed'
         self.keep = keep
 
         load_ruleset(self.keep.ruleset, self.keep)
-        self.keep.save(modified_only=False)
+        self.keep.migrate()
         self.setWindowTitle('Citadel - Lorekeeper')
         self.setWindowIcon(Icon('fortress_tower'))
         self.setWindowFlags(self.windowFlags())
@@ -165,6 +166,7 @@ class Citadel(QtWidgets.QMainWindow):
         SIGNALS.ENCOUNTER_VARIABLES.connect(self.on_feature)
         SIGNALS.TREASURE_DELETE.connect(self.on_treasure_delete)
         SIGNALS.CITADEL_SHOW.connect(self.activate)
+        SIGNALS.SAVE_STATE.connect(self.on_save_state)
         self.name_edit.textChanged.connect(lambda: self.on_feature())
         self.image_container.TREASURE_CHANGED.connect(lambda: self.on_feature())
         self.notes.CHANGED.connect(lambda: self.on_feature())
@@ -202,6 +204,7 @@ class Citadel(QtWidgets.QMainWindow):
             event.ignore()
             return
         self.keep.save()
+        self.keep.close()
         QtWidgets.QApplication.quit()
 
     def get_building_settings(self) -> dict:
@@ -237,7 +240,7 @@ class Citadel(QtWidgets.QMainWindow):
                                   'Please wait while the Beastiary is being imported.')
                 process.get(lambda: scrape.import_monsters(keep))
 
-        citadel.save(modified_only=False)
+        citadel.save()
         return citadel
 
     @staticmethod
@@ -267,6 +270,10 @@ class Citadel(QtWidgets.QMainWindow):
     def on_feature(self, _: str = None, __: int = None):
         self.is_modified = True
 
+    def on_save_state(self, state: str):
+        self._save_state = state
+        self.reload_title()
+
     def on_treasure_delete(self, db_index: int):
         if not (treasure := self.image_container.treasure) or db_index != treasure.db_index:
             return
@@ -289,6 +296,9 @@ class Citadel(QtWidgets.QMainWindow):
         title = 'Citadel - Lorekeeper'
         if self.is_modified:
             title += ' (modified)'
+        match self._save_state:
+            case 'pending': title += ' (saving)'
+            case 'failed': title += ' (save failed)'
         self.setWindowTitle(title)
 
     def save(self, modified_only: bool = True):
@@ -33,6 +33,9 @@ class Lorekeeper(QtWidgets.QApplication):
             lambda table_name, db_index: self.logger.info(f'Commit {table_name}#{db_index}'))
         SIGNALS.FEATURE_DELETE.connect(
             lambda table_name, db_index: self.logger.info(f'Delete {table_name}#{db_index}'))
+        SIGNALS.BUILDING_CHANGED.connect(
+            lambda table_name, db_indices: self.logger.info(f'Batch {table_name} ({len(db_indices)} rows)'))
+        SIGNALS.SAVE_STATE.connect(lambda state: self.logger.info(f'Save {state}'))
 
     @staticmethod
     def create_paths():
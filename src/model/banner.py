@@ -2,6 +2,9 @@ from .feature import Feature
 
 
 class Banner(Feature):
+    __slots__ = ()
     TABLE_NAME = 'banner'
+    RELATIONS = {'_encounter': 'cascade'}
+    CATEGORIES = ('name',)
     name: str
     _encounter: int
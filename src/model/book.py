@@ -5,8 +5,11 @@ from .treasure import Treasure
 
 
 class Book(Feature):
+    __slots__ = ()
     TABLE_NAME = 'book'
     TAG_TABLE_NAME = 'keyword'
+    RELATIONS = {'_treasure': 'set_null'}
+    CATEGORIES = ('type',)
     name: str
     text: str
     keywords: str
@@ -24,15 +27,14 @@ class Book(Feature):
         return self['text']
 
     def get_tags(self) -> list[str]:
-        df = self.keep.buildings['keyword'].df
-        return df[df['_book'] == self.db_index]['name'].values.tolist()
+        return self.keep.buildings['keyword'].select('name', '_book', self.db_index)
 
     @property
     def icon_name(self) -> str:
         return self['type']
 
-    def to_image(self) -> QImage:
+    def to_image(self, size: int | None = None) -> QImage:
         try:
-            return Treasure.read_keep(self.keep, self['_treasure']).to_image()
+            return Treasure.read_keep(self.keep, self['_treasure']).to_image(size)
         except KeyError:
-            return super().to_image()
+            return super().to_image(size)
@@ -1,40 +1,444 @@
-from typing import Type, TypeVar
+import bisect
+from collections import defaultdict, deque
+import itertools
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, ClassVar, Iterable, Iterator, Literal, NamedTuple, Type, TypeVar
 
+import numpy as np
 import pandas as pd
 
+from .scribe import Snapshot
+
 Feature = TypeVar('Feature')
 Keep = TypeVar('Keep')
 
 
+class Change(NamedTuple):
+    action: Literal['insert', 'update', 'delete']
+    db_index: int
+    version: int
+
+
 class Building:
+    CHANGE_LOG_SIZE: ClassVar[int] = 4096
+    PENDING_LIMIT: ClassVar[int] = 4096
+    VECTORIZE_SIZE: ClassVar[int] = 100
 
     def __init__(self, keep: Keep, feature_type: Type[Feature]):
-        self.df = pd.DataFrame(columns=list(feature_type.get_default_data().keys()))
-        self.df.index.rename('_index', inplace=True)
         self.keep = keep
-        self.is_modified = False
         self.feature_type = feature_type
+        self._df: pd.DataFrame | None = self.get_empty_frame()
+        self.batch_index: set[int] = set()
+        self.pending: dict[int, dict] = {}
+        self.view: dict[str, tuple[np.ndarray, np.ndarray | None]] = {}
+        self.relations: dict[str, defaultdict[Any, set[int]]] = {}
+        self.orderings: dict[tuple[str, str], defaultdict[Any, list[tuple[Any, int]]]] = {}
+        self.inserted: set[int] = set()
+        self.updated: set[int] = set()
+        self.deleted: set[int] = set()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.sequence: int | None = None
+        self.table_columns: tuple[str, ...] | None = None
+        self.sequence_lock = threading.Lock()
+        self.version = 0
+        self.changes: deque[Change] = deque(maxlen=self.CHANGE_LOG_SIZE)
 
-    def reset_columns(self):
-        if not self.df.empty:
+    def add_categories(self, column: str, values: Iterable):
+        series = self.frame[column]
+        if not isinstance(series.dtype, pd.CategoricalDtype):
             return
-        for column in list(self.feature_type.get_default_data().keys()):
-            self.df[column] = pd.Series()
+        if new := set(values).difference(series.cat.categories):
+            self._df[column] = series.cat.add_categories(sorted(new))
+            self.view.clear()
 
-    @classmethod
-    def read_keep(cls, keep: Keep, feature_type: Type[Feature]):
-        building = cls(keep=keep, feature_type=feature_type)
+    def changes_since(self, version: int) -> list[Change] | None:
+        if version >= self.version:
+            return []
+        if not self.changes or self.changes[0].version > version + 1:
+            return None
+        return list(itertools.islice(self.changes, version + 1 - self.changes[0].version, None))
+
+    def compact(self):
+        if not self.is_loaded:
+            return
+        self.keep.flush([self], rebuild=True)
+
+    def create_table(self):
+        for statement in self.feature_type.get_schema():
+            self.keep.connection.execute(statement)
+        self.table_columns = None
+
+    @property
+    def df(self) -> pd.DataFrame:
+        self.fold()
+        return self.frame
+
+    def drop(self, index: Iterable[int]):
+        index = [int(db_index) for db_index in index]
+        if not index:
+            return
+        df = self.df
+        for column, relation in self.relations.items():
+            for db_index, value in zip(index, df.loc[index, column].tolist()):
+                relation[value].discard(db_index)
+        for (column, order_by), ordering in self.orderings.items():
+            for db_index, value, order in zip(index, df.loc[index, column].tolist(), df.loc[index, order_by].tolist()):
+                self.remove_ordered(ordering[value], order, db_index)
+        df.drop(index, axis='index', inplace=True)
+        self.view.clear()
+        self.reset_columns()
+        if self.keep.is_batching:
+            self.batch_index.update(index)
+        for db_index in index:
+            self.record_change('delete', db_index)
+            self.updated.discard(db_index)
+            if db_index in self.inserted:
+                self.inserted.discard(db_index)
+            else:
+                self.deleted.add(db_index)
+
+    def drop_where(self, column: str, value: Any):
+        self.drop(self.get_index(column, value))
+
+    def fold(self):
+        if not self.pending:
+            return
+        rows = pd.DataFrame.from_dict(self.pending, orient='index', columns=self.frame.columns)
+        rows.index.rename('_index', inplace=True)
+        if self.frame.empty:
+            rows = self.set_dtypes(rows)
+        else:
+            for column in self.feature_type.CATEGORIES:
+                if column in rows.columns:
+                    self.add_categories(column, rows[column].unique())
+            rows = self.set_dtypes(rows, self.frame.dtypes.to_dict())
+        self.pending = {}
+        self._df = rows if self.frame.empty else pd.concat([self.frame, rows])
+        self.view.clear()
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        if self._df is None:
+            self.load()
+        return self._df
+
+    def format_timestamps(self, df: pd.DataFrame) -> pd.DataFrame:
+        converted = {}
+        for column in self.feature_type.TIMESTAMP_COLUMNS:
+            if column not in df.columns or not pd.api.types.is_integer_dtype(df[column].dtype):
+                continue
+            values = df[column].tolist()
+            if len(unique := set(values)) < self.VECTORIZE_SIZE:
+                strings = {value: self.feature_type.format_timestamp(value) for value in unique}
+                converted[column] = [strings[value] for value in values]
+            else:
+                timestamps = pd.to_datetime(df[column], unit='s', origin=self.feature_type.EPOCH)
+                strings = timestamps.dt.strftime(self.feature_type.TIMESTAMP_FORMAT)
+                converted[column] = strings.where(df[column] != 0, '')
+        return df.assign(**converted) if converted else df
+
+    def get_data(self, db_index: int) -> dict[str, Any]:
+        if db_index in self.pending:
+            return self.pending[db_index]
+        position = self.get_position(db_index)
+        return {column: self.read_cell(*self.get_column(column), position) for column in self.frame.columns}
+
+    def get_column(self, column: str) -> tuple[np.ndarray, np.ndarray | None]:
+        if column not in self.view:
+            series = self.frame[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                self.view[column] = (series.cat.codes.to_numpy(), series.cat.categories.to_numpy())
+            else:
+                self.view[column] = (series.to_numpy(), None)
+        return self.view[column]
+
+    def get_empty_frame(self) -> pd.DataFrame:
+        df = pd.DataFrame(columns=list(self.feature_type.get_default_data().keys()))
+        df.index.rename('_index', inplace=True)
+        return df
+
+    def get_index(self, column: str, value: Any) -> list[int]:
+        return sorted(self.get_relation(column).get(value, ()))
+
+    def get_max_index(self) -> int:
         try:
-            sql_result = pd.read_sql(f'SELECT * FROM {feature_type.TABLE_NAME}', con=keep.connection,
-                                     index_col='_index')
+            table_max = self.keep.connection.execute(
+                f'SELECT MAX(_index) FROM "{self.feature_type.TABLE_NAME}"').fetchone()[0] or 0
+        except sqlite3.OperationalError:
+            table_max = 0
+        frame_max = int(self._df.index.max()) if self.is_loaded and not self._df.empty else 0
+        return max(table_max, frame_max, max(self.pending, default=0))
+
+    def get_value(self, db_index: int, column: str) -> Any:
+        if db_index in self.pending:
+            return self.pending[db_index][column]
+        return self.read_cell(*self.get_column(column), self.get_position(db_index))
+
+    def get_new_index(self) -> int:
+        return self.reserve().start
+
+    def get_ordered_index(self, column: str, value: Any, order_by: str) -> list[int]:
+        return [db_index for _, db_index in self.get_ordering(column, order_by).get(value, ())]
+
+    def get_ordering(self, column: str, order_by: str) -> defaultdict[Any, list[tuple[Any, int]]]:
+        if (column, order_by) not in self.orderings:
+            ordering = defaultdict(list)
+            df = self.frame
+            for db_index, value, order in zip(df.index.tolist(), df[column].tolist(), df[order_by].tolist()):
+                ordering[value].append((order, db_index))
+            for db_index, row in self.pending.items():
+                ordering[row[column]].append((row[order_by], db_index))
+            for entries in ordering.values():
+                entries.sort()
+            self.orderings[column, order_by] = ordering
+        return self.orderings[column, order_by]
+
+    def get_position(self, db_index: int) -> int:
+        if '_index' not in self.view:
+            index = self.frame.index
+            self.view['_index'] = (index.to_numpy() if index.is_monotonic_increasing else None, None)
+        if (index := self.view['_index'][0]) is None:
+            return self.frame.index.get_loc(db_index)
+        position = int(index.searchsorted(db_index))
+        if position == len(index) or index.item(position) != db_index:
+            raise KeyError(db_index)
+        return position
+
+    def get_relation(self, column: str) -> defaultdict[Any, set[int]]:
+        if column not in self.relations:
+            relation = defaultdict(set)
+            df = self.frame
+            for db_index, value in zip(df.index.tolist(), df[column].tolist()):
+                relation[value].add(db_index)
+            for db_index, row in self.pending.items():
+                relation[row[column]].add(db_index)
+            self.relations[column] = relation
+        return self.relations[column]
+
+    def get_row(self, db_index: int) -> pd.Series:
+        if db_index in self.pending:
+            return pd.Series(self.pending[db_index], name=db_index)
+        return self.frame.loc[db_index].copy()
+
+    def get_table_columns(self) -> tuple[str, ...]:
+        if self.table_columns is None:
+            cursor = self.keep.connection.execute(f'PRAGMA table_info("{self.feature_type.TABLE_NAME}")')
+            self.table_columns = tuple(row[1] for row in cursor.fetchall())
+        return self.table_columns
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._df is not None
+
+    @property
+    def is_modified(self) -> bool:
+        return bool(self.inserted or self.updated or self.deleted)
+
+    def iter_data(self, index: Iterable[int] | None = None) -> Iterator[tuple[int, dict[str, Any]]]:
+        if index is not None:
+            for db_index in index:
+                yield db_index, self.get_data(db_index)
+            return
+        df = self.frame
+        columns = df.columns.tolist()
+        for db_index, *row in zip(df.index.tolist(), *(df[column].tolist() for column in columns)):
+            yield db_index, dict(zip(columns, row))
+        yield from self.pending.items()
+
+    def mark_modified(self, db_index: int):
+        if db_index in self.inserted:
+            return
+        if db_index in self.frame.index or db_index in self.deleted:
+            self.deleted.discard(db_index)
+            self.updated.add(db_index)
+        else:
+            self.inserted.add(db_index)
+
+    def load(self):
+        table_name = self.feature_type.TABLE_NAME
+        start = time.perf_counter()
+        try:
+            sql_result = pd.read_sql(f'SELECT * FROM {table_name}', con=self.keep.connection, index_col='_index')
+            self.table_columns = ('_index',) + tuple(sql_result.columns.tolist())
             not_null_mask = sql_result.notnull().all(axis=1)
-            building.df = sql_result[not_null_mask]
+            self._df = self.set_dtypes(self.parse_timestamps(sql_result[not_null_mask]))
         except pd.errors.DatabaseError:
-            pass
+            self._df = self.get_empty_frame()
+            self.table_columns = None
+        self.view.clear()
+        seconds = time.perf_counter() - start
+        self.keep.load_timings[table_name] = seconds
+        self.logger.info(f'Load {table_name}: {len(self._df.index)} rows in {seconds * 1000:.1f} ms')
+
+    def parse_timestamps(self, df: pd.DataFrame) -> pd.DataFrame:
+        converted = {}
+        for column in self.feature_type.TIMESTAMP_COLUMNS:
+            if column in df.columns and not pd.api.types.is_integer_dtype(df[column].dtype):
+                timestamps = pd.to_datetime(df[column], format=self.feature_type.TIMESTAMP_FORMAT, errors='coerce')
+                seconds = (timestamps - self.feature_type.EPOCH) // pd.Timedelta(seconds=1)
+                converted[column] = seconds.fillna(0).astype('int64')
+        return df.assign(**converted) if converted else df
+
+    @staticmethod
+    def read_cell(values: np.ndarray, categories: np.ndarray | None, position: int) -> Any:
+        if categories is None:
+            return values.item(position)
+        code = values.item(position)
+        return categories.item(code) if code >= 0 else np.nan
+
+    def read_many(self, index: Iterable[int] | None = None) -> list[Feature]:
+        return [self.feature_type(self.keep, db_index, data) for db_index, data in self.iter_data(index)]
+
+    @classmethod
+    def read_keep(cls, keep: Keep, feature_type: Type[Feature]):
+        building = cls(keep=keep, feature_type=feature_type)
+        building._df = None
         return building
 
+    def migrate(self, version: int):
+        table_name = self.feature_type.TABLE_NAME
+        self.table_columns = None
+        table_info = self.keep.connection.execute(f'PRAGMA table_info("{table_name}")').fetchall()
+        if not table_info:
+            self.create_table()
+            return
+        if version < 1 and not any(name == '_index' and pk for _, name, _, _, _, pk in table_info):
+            self.logger.info(f'Migrate {table_name} to typed schema')
+            columns = ', '.join(f'"{name}"' for _, name, *_ in table_info
+                                if name == '_index' or name in self.feature_type.get_default_data())
+            self.keep.connection.execute(f'ALTER TABLE "{table_name}" RENAME TO "{table_name}_untyped"')
+            self.create_table()
+            self.keep.connection.execute(f'INSERT OR REPLACE INTO "{table_name}" ({columns}) '
+                                         f'SELECT {columns} FROM "{table_name}_untyped" WHERE _index IS NOT NULL')
+            self.keep.connection.execute(f'DROP TABLE "{table_name}_untyped"')
+            return
+        table_columns = [name for _, name, *_ in table_info]
+        for column, value in self.feature_type.get_default_data().items():
+            if column in table_columns:
+                continue
+            self.logger.info(f'Add column {table_name}.{column}')
+            self.keep.connection.execute(f'ALTER TABLE "{table_name}" ADD COLUMN '
+                                         f'{self.feature_type.get_column_definition(column, value)}')
+
+    def record_change(self, action: Literal['insert', 'update', 'delete'], db_index: int):
+        self.version += 1
+        self.changes.append(Change(action=action, db_index=db_index, version=self.version))
+
+    @staticmethod
+    def remove_ordered(entries: list[tuple[Any, int]], order: Any, db_index: int):
+        position = bisect.bisect_left(entries, (order, db_index))
+        if position < len(entries) and entries[position] == (order, db_index):
+            del entries[position]
+
+    def reserve(self, count: int = 1) -> range:
+        with self.sequence_lock:
+            if self.sequence is None:
+                self.sequence = self.get_max_index()
+            start = self.sequence + 1
+            self.sequence += count
+            return range(start, self.sequence + 1)
+
+    def reset_changes(self):
+        self.inserted.clear()
+        self.updated.clear()
+        self.deleted.clear()
+
+    def reset_columns(self):
+        if self.df.empty:
+            self._df = self.get_empty_frame()
+            self.view.clear()
+
     def save(self, modified_only: bool = True):
-        if modified_only and not self.is_modified:
+        self.keep.flush([self], rebuild=not modified_only)
+
+    def select(self, column: str, where: str, value: Any, order_by: str = None) -> list:
+        index = self.get_ordered_index(where, value, order_by) if order_by else self.get_index(where, value)
+        return [self.get_value(db_index, column) for db_index in index]
+
+    def set_dtypes(self, df: pd.DataFrame, dtypes: dict[str, Any] | None = None) -> pd.DataFrame:
+        if df.empty:
+            return df
+        converted = {}
+        for column, dtype in (dtypes or self.feature_type.get_dtypes()).items():
+            if column not in df.columns or df[column].dtype == dtype:
+                continue
+            try:
+                converted[column] = df[column].astype(dtype)
+            except (TypeError, ValueError) as err:
+                self.logger.warning(f'Keep {self.feature_type.TABLE_NAME}.{column} as {df[column].dtype}: {err}')
+        return df.assign(**converted) if converted else df
+
+    def set_row(self, db_index: int, data: pd.Series | dict):
+        exists = db_index in self.pending or db_index in self.frame.index
+        for column, relation in self.relations.items():
+            if exists:
+                relation[self.get_value(db_index, column)].discard(db_index)
+            relation[data[column]].add(db_index)
+        for (column, order_by), ordering in self.orderings.items():
+            if exists:
+                self.remove_ordered(ordering[self.get_value(db_index, column)], self.get_value(db_index, order_by),
+                                    db_index)
+            bisect.insort(ordering[data[column]], (data[order_by], db_index))
+        self.mark_modified(db_index)
+        self.record_change('update' if exists else 'insert', db_index)
+        if self.keep.is_batching:
+            self.batch_index.add(db_index)
+        if db_index in self.pending or not exists:
+            self.pending[db_index] = dict(data)
+            if len(self.pending) >= self.PENDING_LIMIT:
+                self.fold()
             return
-        self.df.to_sql(name=self.feature_type.TABLE_NAME, con=self.keep.connection, if_exists='replace')
-        self.is_modified = False
+        for column in self.feature_type.CATEGORIES:
+            if column in data:
+                self.add_categories(column, (data[column],))
+        self.frame.loc[db_index] = pd.Series(data)
+        self.view.clear()
+
+    def set_value(self, index: Iterable[int], column: str, value: Any):
+        index = [int(db_index) for db_index in index]
+        if not index:
+            return
+        if column in self.relations:
+            relation = self.relations[column]
+            for db_index, old_value in zip(index, self.df.loc[index, column].tolist()):
+                relation[old_value].discard(db_index)
+            relation[value].update(index)
+        for (ordering_column, order_by), ordering in self.orderings.items():
+            if column not in (ordering_column, order_by):
+                continue
+            for db_index in index:
+                old_value, order = self.get_value(db_index, ordering_column), self.get_value(db_index, order_by)
+                self.remove_ordered(ordering[old_value], order, db_index)
+                if column == ordering_column:
+                    bisect.insort(ordering[value], (order, db_index))
+                else:
+                    bisect.insort(ordering[old_value], (value, db_index))
+        self.add_categories(column, (value,))
+        self.df.loc[index, column] = value
+        self.view.clear()
+        if self.keep.is_batching:
+            self.batch_index.update(index)
+        for db_index in index:
+            self.mark_modified(db_index)
+            self.record_change('update', db_index)
+
+    def snapshot(self, rebuild: bool = False) -> Snapshot | None:
+        if not self.is_loaded or not (rebuild or self.is_modified):
+            return None
+        df = self.df
+        columns = ('_index',) + tuple(df.columns.tolist())
+        if not rebuild and sorted(self.get_table_columns()) != sorted(columns):
+            rebuild = True
+        if rebuild:
+            self.table_columns = columns
+        index = df.index if rebuild else sorted(self.inserted | self.updated)
+        rows = tuple(tuple(value.item() if isinstance(value, np.generic) else value for value in row)
+                     for row in self.format_timestamps(df.loc[index]).itertuples(name=None))
+        snapshot = Snapshot(table_name=self.feature_type.TABLE_NAME, columns=columns,
+                            deleted=() if rebuild else tuple(sorted(self.deleted)), rows=rows,
+                            schema=tuple(self.feature_type.get_schema()) if rebuild else ())
+        self.reset_changes()
+        return snapshot
@@ -2,7 +2,9 @@ from .feature import Feature
 
 
 class Chart(Feature):
+    __slots__ = ()
     TABLE_NAME = 'chart'
+    RELATIONS = {'_page': 'cascade', '_treasure': 'cascade'}
     _treasure: int
     _page: int
     list_index: int
@@ -2,7 +2,10 @@ from .feature import Feature
 
 
 class Combatant(Feature):
+    __slots__ = ()
     TABLE_NAME = 'combatant'
+    RELATIONS = {'_encounter': 'cascade', '_guard': 'set_null'}
+    CATEGORIES = ('type',)
     _encounter: int
     _guard: int
     name: str
@@ -0,0 +1,73 @@
+import logging
+from pathlib import Path
+import tempfile
+from typing import ClassVar, NamedTuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from .digest import Digest
+from src.settings import PATHS
+
+
+class Delivery(NamedTuple):
+    path: Path
+    uuid: str
+    size: int
+
+
+class Courier:
+    BACKOFF_FACTOR: ClassVar[float] = .5
+    MAX_SIZE: ClassVar[int] = 64 << 20
+    POOL_SIZE: ClassVar[int] = 8
+    RETRIES: ClassVar[int] = 3
+    RETRY_STATUSES: ClassVar[tuple[int, ...]] = (429, 500, 502, 503, 504)
+    TIMEOUT: ClassVar[tuple[float, float]] = (5., 30.)
+
+    def __init__(self, retries: int = RETRIES, backoff_factor: float = BACKOFF_FACTOR,
+                 timeout: tuple[float, float] = TIMEOUT, max_size: int = MAX_SIZE):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.logger = logging.getLogger(self.__class__.__name__)
+        retry = Retry(total=retries, backoff_factor=backoff_factor, status_forcelist=self.RETRY_STATUSES,
+                      allowed_methods=('GET', 'HEAD'))
+        adapter = HTTPAdapter(pool_connections=self.POOL_SIZE, pool_maxsize=self.POOL_SIZE, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def close(self):
+        self.session.close()
+
+    def deliver(self, url: str) -> Delivery:
+        with self.session.get(url, stream=True, timeout=self.timeout) as answer:
+            answer.raise_for_status()
+            if int(answer.headers.get('Content-Length') or 0) > self.max_size:
+                raise ValueError(f'{url} is larger than {self.max_size} bytes.')
+            with tempfile.NamedTemporaryFile(dir=PATHS['workbench'], delete=False) as file:
+                path = Path(file.name)
+                try:
+                    digest, size = self.stream(answer, file)
+                except BaseException:
+                    file.close()
+                    path.unlink(missing_ok=True)
+                    raise
+        target = PATHS['inventory'].joinpath(digest.uuid)
+        try:
+            path.rename(target)
+        except FileExistsError:
+            path.unlink()
+        self.logger.debug(f'Delivered {size} bytes from {url}')
+        return Delivery(target, digest.uuid, size)
+
+    def stream(self, answer: requests.Response, file) -> tuple[Digest, int]:
+        digest = Digest()
+        size = 0
+        for chunk in answer.iter_content(Digest.CHUNK_SIZE):
+            size += len(chunk)
+            if size > self.max_size:
+                raise ValueError(f'{answer.url} is larger than {self.max_size} bytes.')
+            file.write(chunk)
+            digest.update(chunk)
+        return digest, size
@@ -0,0 +1,28 @@
+import hashlib
+import os
+from typing import ClassVar
+import uuid
+
+
+class Digest:
+    CHUNK_SIZE: ClassVar[int] = 1 << 20
+
+    def __init__(self):
+        self.sha1 = hashlib.sha1(uuid.NAMESPACE_URL.bytes)
+
+    def update(self, chunk: bytes | memoryview):
+        self.sha1.update(chunk.hex().encode('ascii'))
+
+    def update_bytes(self, b: bytes):
+        view = memoryview(b)
+        for start in range(0, len(view), self.CHUNK_SIZE):
+            self.update(view[start:start + self.CHUNK_SIZE])
+
+    def update_file(self, path: str | os.PathLike[str]):
+        with open(path, 'rb') as file:
+            while chunk := file.read(self.CHUNK_SIZE):
+                self.update(chunk)
+
+    @property
+    def uuid(self) -> str:
+        return uuid.UUID(bytes=self.sha1.digest()[:16], version=5).hex
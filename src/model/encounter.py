@@ -4,6 +4,7 @@ from .feature import Feature
 
 
 class Encounter(Feature):
+    __slots__ = ()
     TABLE_NAME = 'encounter'
     TAG_TABLE_NAME = 'banner'
     name: str
@@ -16,8 +17,8 @@ class Encounter(Feature):
         return super().commit()
 
     def get_combatant_frame(self) -> pd.DataFrame:
-        df = self.keep.buildings['combatant'].df
-        return df[df['_encounter'] == self.db_index]
+        building = self.keep.buildings['combatant']
+        return building.df.loc[building.get_index('_encounter', self.db_index)]
 
     def get_html(self) -> str:
         return self['text'] or f'<i>{self["combatants"]}</i>'
@@ -26,8 +27,7 @@ class Encounter(Feature):
         return self['text'] or self['combatants']
 
     def get_tags(self) -> list[str]:
-        df = self.keep.buildings['banner'].df
-        return df[df['_encounter'] == self.db_index]['name'].values.tolist()
+        return self.keep.buildings['banner'].select('name', '_encounter', self.db_index)
 
     @property
     def icon_name(self) -> str:
@@ -1,6 +1,6 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from html.parser import HTMLParser
-from typing import ClassVar, Literal, TypeVar
+from typing import Any, ClassVar, Iterable, Literal, Mapping, TypeVar
 
 import pandas as pd
 from PySide2.QtGui import QImage
@@ -12,85 +12,187 @@ Keep = TypeVar('Keep')
 
 
 class TextParser(HTMLParser):
+    SKIPPED_TAGS: ClassVar[tuple[str, ...]] = ('head', 'script', 'style', 'title')
 
     def __init__(self):
         super().__init__()
-        self.body = False
-        self.text = ''
+        self.chunks: list[str] = []
+        self.skipped = 0
 
     def handle_data(self, data: str):
-        if self.body:
-            self.text += data
+        if not self.skipped:
+            self.chunks.append(data)
 
     def handle_endtag(self, tag: str):
-        if tag == 'body':
-            self.body = False
+        if tag in self.SKIPPED_TAGS and self.skipped:
+            self.skipped -= 1
 
     def handle_starttag(self, tag: str, _):
-        if tag == 'body':
-            self.body = True
+        if tag in self.SKIPPED_TAGS:
+            self.skipped += 1
+
+    @property
+    def text(self) -> str:
+        return ''.join(self.chunks)
 
 
-class Feature(pd.Series):
+class Feature:
+    __slots__ = ('building', 'data', 'db_index', 'keep')
     BYTE_SIZE: ClassVar[int] = 8
+    CATEGORIES: ClassVar[tuple[str, ...]] = ()
+    DTYPES: ClassVar[dict[type, str]] = {float: 'float64', int: 'int64', str: 'object'}
     ENDIANNESS: ClassVar[Literal['little', 'big']] = 'big'
+    EPOCH: ClassVar[datetime] = datetime(1970, 1, 1)
+    RELATIONS: ClassVar[dict[str, Literal['cascade', 'set_null']]] = {}
+    SQL_TYPES: ClassVar[dict[type, str]] = {float: 'REAL', int: 'INTEGER', str: 'TEXT'}
     TABLE_NAME: ClassVar[str] = None
     TAG_TABLE_NAME: ClassVar[str] = None
+    TEXT_CACHE_SIZE: ClassVar[int] = 4096
+    TIMESTAMP_COLUMNS: ClassVar[tuple[str, ...]] = ('_created', '_modified')
     TIMESTAMP_FORMAT: ClassVar[str] = '%Y-%m-%d %H:%M:%S'
 
-    def __init__(self, keep: Keep, db_index: int = 0, name: str = None, data: dict = None):
-        super().__init__(name=name, data=self.get_default_data(data))
+    def __init__(self, keep: Keep, db_index: int = 0, data: dict = None):
         self.building = keep.buildings[self.TABLE_NAME]
-        self.df: pd.DataFrame = self.building.df
+        self.data: dict[str, Any] = self.get_record() | (data or {})
         self.db_index = db_index
         self.keep = keep
 
     def __bool__(self) -> bool:
         return True
 
+    def __contains__(self, key: str) -> bool:
+        return key in self.data
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return object.__getattribute__(self, 'data')[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+    def __iter__(self) -> Iterable[str]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.db_index}, {self.data!r})'
+
+    def __setitem__(self, key: str, value: Any):
+        self.data[key] = value
+
     def commit(self) -> int:
         timestamp = self.get_time_stamp()
         self.db_index = self.db_index or self.get_new_index()
         self['_created'] = self['_created'] or timestamp
         self['_modified'] = timestamp
-        self.df.loc[self.db_index] = pd.Series(data=self)
-        self.building.is_modified = True
-        SIGNALS.FEATURE_COMMIT.emit(self.TABLE_NAME, self.db_index)
+        self.building.set_row(self.db_index, self.to_dict())
+        if not self.keep.is_batching:
+            SIGNALS.FEATURE_COMMIT.emit(self.TABLE_NAME, self.db_index)
         return self.db_index
 
     def delete(self):
-        self.df.drop(self.db_index, axis='index', inplace=True)
-        self.building.reset_columns()
-        self.building.is_modified = True
-        SIGNALS.FEATURE_DELETE.emit(self.TABLE_NAME, self.db_index)
+        self.keep.delete(self.TABLE_NAME, [self.db_index])
+
+    @property
+    def df(self) -> pd.DataFrame:
+        return self.building.df
 
     @classmethod
     def get_default_data(cls, data: dict = None) -> dict[str, str | int]:
         return {field_name: dtype() for field_name, dtype in cls.__annotations__.items()} | \
-               {'_created': '', '_modified': ''} | (data or {})
+               {'_created': 0, '_modified': 0} | (data or {})
+
+    @classmethod
+    def format_timestamp(cls, timestamp: int) -> str:
+        return (cls.EPOCH + timedelta(seconds=timestamp)).strftime(cls.TIMESTAMP_FORMAT) if timestamp else ''
+
+    @classmethod
+    def get_column_definition(cls, column: str, value: Any) -> str:
+        if column in cls.TIMESTAMP_COLUMNS:
+            return f'"{column}" TEXT DEFAULT \'\''
+        return f'"{column}" {cls.SQL_TYPES[type(value)]} DEFAULT {value!r}'
+
+    @classmethod
+    def get_dtypes(cls) -> dict[str, str]:
+        return {column: 'category' if column in cls.CATEGORIES else cls.DTYPES[type(value)]
+                for column, value in cls.get_record().items()}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
 
     def get_html(self) -> str:
         return ''
 
     def get_new_index(self) -> int:
-        return max(self.df.index.values.tolist() + [0]) + 1
+        return self.building.get_new_index()
 
     def get_plain_text(self) -> str:
+        if not (html := self.get_html()):
+            return ''
+        cache = self.get_text_cache()
+        key = (self.db_index, self['_modified'])
+        cached_html, text = cache.get(key, (None, ''))
+        if cached_html is html or cached_html == html:
+            return text
         parser = TextParser()
-        parser.feed(self.get_html())
-        return parser.text.strip()
+        parser.feed(html)
+        parser.close()
+        if len(cache) >= self.TEXT_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        text = parser.text.strip()
+        cache[key] = (html, text)
+        return text
+
+    @classmethod
+    def get_record(cls) -> dict[str, Any]:
+        if (record := cls.__dict__.get('_record')) is None:
+            record = cls._record = cls.get_default_data()
+        return record
+
+    @classmethod
+    def get_relation_columns(cls) -> list[str]:
+        return [column for column, value in cls.get_default_data().items()
+                if column.startswith('_') and isinstance(value, int) and column not in cls.TIMESTAMP_COLUMNS]
+
+    @classmethod
+    def get_schema(cls) -> list[str]:
+        columns = ['"_index" INTEGER PRIMARY KEY'] + \
+                  [cls.get_column_definition(column, value) for column, value in cls.get_default_data().items()]
+        return [f'CREATE TABLE IF NOT EXISTS "{cls.TABLE_NAME}" ({", ".join(columns)})'] + \
+               [f'CREATE INDEX IF NOT EXISTS "{cls.TABLE_NAME}_{column}" ON "{cls.TABLE_NAME}" ("{column}")'
+                for column in cls.get_relation_columns()]
 
     def get_tags(self) -> list[str]:
         return []
 
+    def get_text(self, key: str) -> str:
+        value = self.get(key, '')
+        return self.format_timestamp(value) if key in self.TIMESTAMP_COLUMNS else str(value)
+
+    @classmethod
+    def get_text_cache(cls) -> dict[tuple[int, int], tuple[str, str]]:
+        if (cache := cls.__dict__.get('_text_cache')) is None:
+            cache = cls._text_cache = {}
+        return cache
+
     @classmethod
-    def get_time_stamp(cls) -> str:
-        return datetime.now().strftime(cls.TIMESTAMP_FORMAT)
+    def get_time_stamp(cls) -> int:
+        return int((datetime.now() - cls.EPOCH).total_seconds())
 
     @property
     def icon_name(self) -> str:
         return ''
 
+    def items(self) -> Iterable[tuple[str, Any]]:
+        return self.data.items()
+
+    def keys(self) -> Iterable[str]:
+        return self.data.keys()
+
     @classmethod
     def new(cls, keep: Keep):
         return cls(keep=keep, db_index=0)
@@ -100,22 +202,33 @@ class Feature(pd.Series):
         if isinstance(db_index, bytes):
             db_index = int.from_bytes(db_index, cls.ENDIANNESS)
         feature = cls(keep, db_index)
-        feature.update(feature.df.loc[db_index].copy())
+        feature.update(feature.building.get_data(db_index))
         return feature
 
     def reload(self):
         if not self.db_index:
             return
-        copy = self.df.loc[self.db_index]
-        self.update(copy)
+        self.update(self.building.get_data(self.db_index))
 
     def to_bytes(self) -> bytes:
         return self.db_index.to_bytes(self.BYTE_SIZE, self.ENDIANNESS)
 
-    def to_image(self) -> QImage:
+    def to_image(self, _: int | None = None) -> QImage:
         return QImage(PATHS['icons'].joinpath(self.icon_name).as_posix().__str__())
 
+    def to_dict(self) -> dict[str, Any]:
+        return dict(self.data)
+
     def to_mime_data(self) -> QMimeData:
         mime_data = QMimeData()
         mime_data.setData(f'lorekeeper/{self.TABLE_NAME}', QByteArray(self.to_bytes()))
         return mime_data
+
+    def update(self, other: Mapping[str, Any] | pd.Series):
+        data = self.data
+        for key, value in other.items():
+            if key in data:
+                data[key] = value
+
+    def values(self) -> Iterable[Any]:
+        return self.data.values()
@@ -2,7 +2,9 @@ from .feature import Feature
 
 
 class Footnote(Feature):
+    __slots__ = ()
     TABLE_NAME = 'footnote'
+    RELATIONS = {'_book': 'cascade', '_page': 'cascade'}
     _book: int
     _page: int
     list_index: int
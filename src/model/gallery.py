@@ -0,0 +1,116 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+import logging
+from pathlib import Path
+import threading
+from typing import Callable, ClassVar
+
+from PySide2.QtCore import QSize, Qt
+from PySide2.QtGui import QImage
+
+from src.settings import PATHS
+
+
+class Gallery:
+    BYTE_BUDGET: ClassVar[int] = 64 << 20
+    SIZES: ClassVar[tuple[int, ...]] = (64, 256, 1024)
+
+    def __init__(self):
+        self.dimensions: dict[str, QSize] = {}
+        self.images: OrderedDict[tuple[str, int], QImage] = OrderedDict()
+        self.byte_count = 0
+        self.lock = threading.Lock()
+        self.rendering: dict[str, tuple[threading.Lock, int]] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def discard(self, uuid_: str):
+        with self.lock_uuid(uuid_):
+            with self.lock:
+                self.dimensions.pop(uuid_, None)
+            for size in self.SIZES:
+                with self.lock:
+                    if (image := self.images.pop((uuid_, size), None)) is not None:
+                        self.byte_count -= image.sizeInBytes()
+                self.get_path(uuid_, size).unlink(missing_ok=True)
+
+    def get(self, uuid_: str, size: int, decode: Callable[[], QImage]) -> QImage:
+        if (size := self.get_fixed_size(size)) is None:
+            return decode()
+        if (image := self.peek(uuid_, size)) is not None:
+            return image
+        with self.lock_uuid(uuid_):
+            if (image := self.peek(uuid_, size)) is not None:
+                return image
+            path = self.get_path(uuid_, size)
+            image = QImage(path.as_posix().__str__()) if path.exists() else QImage()
+            if image.isNull():
+                image = self.render(uuid_, decode()).get(size, QImage())
+            self.put((uuid_, size), image)
+            return image
+
+    def get_dimensions(self, uuid_: str, read: Callable[[], QSize]) -> QSize:
+        with self.lock:
+            if (size := self.dimensions.get(uuid_)) is not None:
+                return size
+        size = read()
+        if size.isValid():
+            with self.lock:
+                self.dimensions[uuid_] = size
+        return size
+
+    def get_fixed_size(self, size: int) -> int | None:
+        return next((fixed for fixed in self.SIZES if fixed >= size), None)
+
+    @staticmethod
+    def get_path(uuid_: str, size: int) -> Path:
+        return PATHS['thumbnails'].joinpath(f'{uuid_}_{size}.png')
+
+    @contextmanager
+    def lock_uuid(self, uuid_: str):
+        with self.lock:
+            lock, count = self.rendering.get(uuid_) or (threading.Lock(), 0)
+            self.rendering[uuid_] = (lock, count + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self.lock:
+                lock, count = self.rendering.pop(uuid_)
+                if count > 1:
+                    self.rendering[uuid_] = (lock, count - 1)
+
+    def peek(self, uuid_: str, size: int) -> QImage | None:
+        if (size := self.get_fixed_size(size)) is None:
+            return None
+        with self.lock:
+            if (image := self.images.get((uuid_, size))) is not None:
+                self.images.move_to_end((uuid_, size))
+            return image
+
+    def put(self, key: tuple[str, int], image: QImage):
+        with self.lock:
+            if (replaced := self.images.pop(key, None)) is not None:
+                self.byte_count -= replaced.sizeInBytes()
+            self.images[key] = image
+            self.byte_count += image.sizeInBytes()
+            while self.byte_count > self.BYTE_BUDGET and len(self.images) > 1:
+                _, evicted = self.images.popitem(last=False)
+                self.byte_count -= evicted.sizeInBytes()
+
+    def render(self, uuid_: str, image: QImage) -> dict[int, QImage]:
+        if image.isNull():
+            return {}
+        thumbnails = {}
+        for size in self.SIZES:
+            if image.width() > size or image.height() > size:
+                thumbnails[size] = image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            else:
+                thumbnails[size] = image
+            path = self.get_path(uuid_, size)
+            temp_path = path.with_suffix('.part')
+            if thumbnails[size].save(temp_path.as_posix().__str__(), 'PNG'):
+                temp_path.replace(path)
+            else:
+                temp_path.unlink(missing_ok=True)
+                self.logger.warning(f'Could not save thumbnail {uuid_} ({size} px)')
+        return thumbnails
@@ -2,6 +2,9 @@ from .feature import Feature
 
 
 class Genre(Feature):
+    __slots__ = ()
     TABLE_NAME = 'genre'
+    RELATIONS = {'_minstrel': 'cascade'}
+    CATEGORIES = ('name',)
     _minstrel: int
     name: str
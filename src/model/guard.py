@@ -1,25 +1,19 @@
 import inspect
 import re
-from typing import get_type_hints, TypeVar
+from typing import get_type_hints
 
 from .feature import Feature
+from .template import Template
 from src.model import Combatant
 
-Keep = TypeVar('Keep')
-
 
 class Guard(Feature):
+    __slots__ = ()
     TABLE_NAME = 'guard'
     TAG_TABLE_NAME = 'trait'
-    REGEX_BRACKET = re.compile(r'\[([^\]]*?)\]')
-    REGEX_GENDERED = re.compile(r'([^\/]*)\/([^\/]*)\/([^\/]*)')
-    REGEX_HTML = re.compile(r'<.*?>')
-    REGEX_ROLL = re.compile(r'(\d+d\d+)\s*?[+-]0')
-
-    def __init__(self, keep: Keep, db_index: int = 0, name: str = None, data: dict = None):
-        super().__init__(keep=keep, db_index=db_index, name=name, data=data)
-        self.property_regex = re.compile(rf'(?<!\w)({"|".join(self.get_properties())})(?!\w)',
-                                         re.IGNORECASE)
+    RELATIONS = {'_treasure': 'set_null'}
+    RENDER_CACHE_SIZE = 4096
+    CATEGORIES = ('alignment', 'size', 'type')
 
     def commit(self) -> int:
         self['traits'] = ', '.join(self.get_tags())
@@ -28,19 +22,21 @@ class Guard(Feature):
     @classmethod
     def get_default_data(cls, data: dict = None) -> dict[str, str | int]:
         return {'name': '', 'gender': 0, 'type': '', '_treasure': 0, 'short_name': '', 'traits': ''} | \
-               super().get_default_data()
+               super().get_default_data(data)
 
     def get_tags(self) -> list[str]:
-        df = self.keep.buildings['trait'].df
-        return df[df['_guard'] == self.db_index]['name'].values.tolist()
+        return self.keep.buildings['trait'].select('name', '_guard', self.db_index)
 
     @staticmethod
     def get_icon_name(type_: str) -> str:
         return ''
 
-    def get_properties(self) -> list[str]:
+    @classmethod
+    def get_properties(cls) -> list[str]:
+        if (result := cls.__dict__.get('_properties')) is not None:
+            return result
         result = []
-        for name, method in inspect.getmembers(self.__class__):
+        for name, method in inspect.getmembers(cls):
             try:
                 if not isinstance(method, property):
                     continue
@@ -49,44 +45,44 @@ class Guard(Feature):
                     result.append(name)
             except (NameError, TypeError):
                 continue
-        result += list(self.keys())
+        result += list(cls.get_record().keys())
+        cls._properties = result
         return result
 
-    def parse(self, text: str) -> str:
+    @classmethod
+    def get_property_regex(cls) -> re.Pattern:
+        if (regex := cls.__dict__.get('_property_regex')) is None:
+            regex = cls._property_regex = re.compile(rf'(?<!\w)({"|".join(cls.get_properties())})(?!\w)',
+                                                     re.IGNORECASE)
+        return regex
 
-        def parse_bracket(content: str) -> str:
-            prefix = ''.join(self.REGEX_HTML.findall(content))
-            content = self.REGEX_HTML.sub('', content)
-            if self.REGEX_GENDERED.findall(content):
-                return self.REGEX_GENDERED.sub(lambda match: match.groups()[self['gender']], content)
-            content = content.replace(' ', '')
-            if not content:
-                return ''
-            format_ = '+d' if content and content[0] in ('+', '-') else ''
-            upper = content[0].isupper()
+    @classmethod
+    def get_render_cache(cls) -> dict[tuple[str, tuple], str]:
+        if (cache := cls.__dict__.get('_render_cache')) is None:
+            cache = cls._render_cache = {}
+        return cache
 
-            def replace(word: str) -> str:
-                word = word.lower()
-                if word == 'name':
-                    short_name = s.lower() if (s := self['short_name'].strip()) else self['name']
-                    return f'the {short_name}' if self['gender'] == 2 else short_name
-                if hasattr(self, word):
-                    return str(getattr(self, word))
-                return self.get(word)
-            content = self.property_regex.sub(lambda match: replace(match.groups()[0]), content)
-            try:
-                result = str(format(eval(content), format_))
-            except (NameError, SyntaxError, ValueError):
-                result = content
-            if upper:
-                result = result.capitalize()
-            return prefix + result
-        return self.REGEX_ROLL.sub(lambda match: match.groups()[0],
-                                   self.REGEX_BRACKET.sub(lambda match: parse_bracket(match[1]), text))
+    def parse(self, text: str) -> str:
+        cache = self.get_render_cache()
+        key = (text, tuple(self.data.values()))
+        if (result := cache.get(key)) is None:
+            if len(cache) >= self.RENDER_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            template = Template.compile(text, self.get_property_regex())
+            result = cache[key] = template.render(self.resolve, self['gender'])
+        return result
 
     @property
     def icon_name(self) -> str:
         return self.get_icon_name(self['type'])
 
+    def resolve(self, word: str) -> str:
+        if word == 'name':
+            short_name = s.lower() if (s := self['short_name'].strip()) else self['name']
+            return f'the {short_name}' if self['gender'] == 2 else short_name
+        if hasattr(self, word):
+            return str(getattr(self, word))
+        return str(self.get(word))
+
     def to_combatant(self) -> Combatant:
         return Combatant(keep=self.keep, db_index=0)
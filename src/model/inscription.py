@@ -2,6 +2,9 @@ from .feature import Feature
 
 
 class Inscription(Feature):
+    __slots__ = ()
     TABLE_NAME = 'inscription'
+    RELATIONS = {'_treasure': 'cascade'}
+    CATEGORIES = ('name',)
     name: str
     _treasure: int
@@ -1,8 +1,10 @@
+from collections import defaultdict
+from contextlib import contextmanager
 import json
 import os
 from pathlib import Path
 import sqlite3
-from typing import Literal, Type
+from typing import ClassVar, Iterable, Type
 import uuid
 
 from PySide2 import QtGui
@@ -12,34 +14,41 @@ from .book import Book
 from .building import Building
 from .chart import Chart
 from .combatant import Combatant
+from .courier import Courier
 from .encounter import Encounter
 from .feature import Feature
 from .footnote import Footnote
+from .gallery import Gallery
 from .genre import Genre
 from .guard import Guard
 from .inscription import Inscription
 from .keyword import Keyword
+from .limner import Limner
 from .minstrel import Minstrel
 from .page import Page
 from .performance import Performance
 from .repertoire import Repertoire
+from .scribe import Scribe
 from .sigil import Sigil
 from .trait import Trait
 from .treasure import Treasure
-from src.settings import PATHS
+from src.settings import PATHS, SIGNALS
 
 
 class Keep:
     FEATURE_TYPES: tuple[Type[Feature], ...] = (Banner, Book, Chart, Combatant, Encounter, Footnote, Genre, Guard,
                                                 Inscription, Keyword, Minstrel, Page, Performance, Repertoire, Sigil,
                                                 Trait, Treasure)
+    SCHEMA_VERSION: ClassVar[int] = 1
 
     def __init__(self, name: str, ruleset: str, uuid_: str = None, treasure_index: int = 0, player_count: int = 4,
                  player_level: int = 1, custom_tokens: list[str] = None, notes: list[tuple[str, str]] = None,
                  building_settings: dict = None, **_):
+        self.batch_depth = 0
         self.buildings: dict[str, Building] = dict()
         self.building_settings = building_settings or {}
         self.custom_tokens: list[str] = custom_tokens or []
+        self.load_timings: dict[str, float] = {}
         self.name = name
         self.notes = notes or []
         self.ruleset = ruleset
@@ -48,13 +57,21 @@ class Keep:
         self.treasure_index = treasure_index
         self.uuid = uuid_ or uuid.uuid4().hex
 
-        self.connection = sqlite3.connect(PATHS['keeps'].joinpath(self.uuid + '.db'))
+        self.connection = sqlite3.connect(PATHS['keeps'].joinpath(self.uuid + '.db'), check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.scribe = Scribe(PATHS['keeps'].joinpath(self.uuid + '.db'))
+        self.scribe.start()
+        self.courier = Courier()
+        self.gallery = Gallery()
+        self.limner = Limner()
         PATHS['inventory'] = PATHS['keeps'].joinpath(self.uuid)
         PATHS['inventory'].mkdir(exist_ok=True)
         PATHS['workbench'] = PATHS['inventory'].joinpath('workbench')
         PATHS['workbench'].mkdir(exist_ok=True)
         PATHS['custom_tokens'] = PATHS['inventory'].joinpath('tokens')
         PATHS['custom_tokens'].mkdir(exist_ok=True)
+        PATHS['thumbnails'] = PATHS['inventory'].joinpath('thumbnails')
+        PATHS['thumbnails'].mkdir(exist_ok=True)
 
     def add_ledger(self) -> int:
         ledger = Book.new(self)
@@ -62,18 +79,125 @@ class Keep:
         ledger['type'] = 'fortress_tower'
         return ledger.commit()
 
-    def create_tables(self, if_exists: Literal['fail', 'replace', 'append'] = 'replace'):
-        for feature_type in self.FEATURE_TYPES:
-            if feature_type.TABLE_NAME == 'guard':
+    @contextmanager
+    def batch(self):
+        self.batch_depth += 1
+        try:
+            yield self
+        finally:
+            self.batch_depth -= 1
+            if not self.batch_depth:
+                self.end_batch()
+
+    def close(self):
+        self.limner.stop()
+        self.courier.close()
+        self.scribe.stop()
+        self.connection.close()
+
+    def create_tables(self):
+        with self.connection:
+            for feature_type in self.FEATURE_TYPES:
+                if feature_type.TABLE_NAME == 'guard':
+                    continue
+                self.buildings[feature_type.TABLE_NAME] = Building(self, feature_type)
+                self.buildings[feature_type.TABLE_NAME].create_table()
+
+    def delete(self, table_name: str, index: Iterable[int]):
+        deleted: defaultdict[str, set[int]] = defaultdict(set)
+        nulled: defaultdict[tuple[str, str], set[int]] = defaultdict(set)
+        queue = [(table_name, set(index))]
+        while queue:
+            table_name, index = queue.pop(0)
+            index -= deleted[table_name]
+            if not index:
                 continue
-            self.buildings[feature_type.TABLE_NAME] = Building(self, feature_type)
-            self.buildings[feature_type.TABLE_NAME].df.to_sql(feature_type.TABLE_NAME, self.connection,
-                                                              if_exists=if_exists)
+            deleted[table_name] |= index
+            for child_name, child in self.buildings.items():
+                for column, rule in child.feature_type.RELATIONS.items():
+                    if column != f'_{table_name}':
+                        continue
+                    relation = child.get_relation(column)
+                    related = set().union(*(relation.get(db_index, ()) for db_index in index))
+                    if rule == 'cascade':
+                        queue.append((child_name, related))
+                    else:
+                        nulled[child_name, column] |= related
+        treasures = self.buildings['treasure']
+        uuids = {treasures.get_value(db_index, 'uuid') for db_index in deleted.get('treasure', ())}
+        for table_name, index in deleted.items():
+            self.buildings[table_name].drop(index)
+        for uuid_ in uuids:
+            if uuid_ and not treasures.get_index('uuid', uuid_):
+                self.gallery.discard(uuid_)
+        updated = defaultdict(set)
+        for (table_name, column), index in nulled.items():
+            index -= deleted[table_name]
+            self.buildings[table_name].set_value(index, column, 0)
+            updated[table_name] |= index
+        if self.is_batching:
+            return
+        self.flush([self.buildings[table_name] for table_name in deleted.keys() | updated.keys()])
+        for table_name, index in deleted.items():
+            for db_index in sorted(index):
+                SIGNALS.FEATURE_DELETE.emit(table_name, db_index)
+        for table_name, index in updated.items():
+            for db_index in sorted(index):
+                SIGNALS.FEATURE_COMMIT.emit(table_name, db_index)
+
+    def end_batch(self):
+        changes = {}
+        self.flush()
+        for table_name, building in self.buildings.items():
+            if building.batch_index:
+                changes[table_name] = tuple(sorted(building.batch_index))
+                building.batch_index.clear()
+        for table_name, db_indices in changes.items():
+            SIGNALS.BUILDING_CHANGED.emit(table_name, db_indices)
+
+    def flush(self, buildings: Iterable[Building] = None, rebuild: bool = False):
+        buildings = self.buildings.values() if buildings is None else buildings
+        snapshots = (building.snapshot(rebuild=rebuild) for building in buildings)
+        self.scribe.submit(tuple(snapshot for snapshot in snapshots if snapshot is not None))
+
+    def get_reference_columns(self, table_name: str) -> list[tuple[str, str]]:
+        tag_table_name = self.buildings[table_name].feature_type.TAG_TABLE_NAME
+        return [(child_name, column) for child_name, child in self.buildings.items() if child_name != tag_table_name
+                for column in child.feature_type.RELATIONS if column == f'_{table_name}']
+
+    def get_references(self, table_name: str, db_index: int) -> dict[str, list[int]]:
+        references = {}
+        for child_name, column in self.get_reference_columns(table_name):
+            if index := self.buildings[child_name].get_index(column, db_index):
+                references[child_name] = index
+        return references
+
+    def get_schema_version(self) -> int:
+        return self.connection.execute('PRAGMA user_version').fetchone()[0]
+
+    @property
+    def is_batching(self) -> bool:
+        return self.batch_depth > 0
+
+    def is_referenced(self, table_name: str, db_index: int) -> bool:
+        return any(self.buildings[child_name].get_relation(column).get(db_index)
+                   for child_name, column in self.get_reference_columns(table_name))
+
+    def migrate(self):
+        version = self.get_schema_version()
+        with self.connection:
+            if version != self.SCHEMA_VERSION and not self.connection.in_transaction:
+                self.connection.execute('BEGIN')
+            for building in self.buildings.values():
+                building.migrate(version)
+            if version != self.SCHEMA_VERSION:
+                self.connection.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
 
     @classmethod
     def new(cls, ruleset: str):
         keep = cls(name=ruleset.title(), ruleset=ruleset)
         keep.create_tables()
+        keep.migrate()
         keep.add_ledger()
         return keep
 
@@ -88,13 +212,12 @@ class Keep:
         return keep
 
     def save(self, modified_only: bool = True):
-        for building in self.buildings.values():
-            building.save(modified_only=modified_only)
+        self.flush(rebuild=not modified_only)
         self.save_config()
 
     def save_config(self):
         try:
-            image = Treasure.read_keep(self, self.treasure_index).to_image()
+            image = Treasure.read_keep(self, self.treasure_index).to_image(256)
         except (FileNotFoundError, KeyError):
             image = QtGui.QImage(PATHS['images'].joinpath(self.ruleset + '.png').as_posix().__str__())
         image = image.convertToFormat(QtGui.QImage.Format_ARGB32).scaled(250, 250)
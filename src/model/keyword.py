@@ -2,6 +2,9 @@ from .feature import Feature
 
 
 class Keyword(Feature):
+    __slots__ = ()
     TABLE_NAME = 'keyword'
+    RELATIONS = {'_book': 'cascade'}
+    CATEGORIES = ('name',)
     name: str
     _book: int
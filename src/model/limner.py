@@ -0,0 +1,75 @@
+import logging
+import threading
+from typing import TypeVar
+
+from PySide2.QtCore import QRunnable, QSize, Qt, QThreadPool
+from PySide2.QtGui import QColor, QImage
+
+from src.settings import SIGNALS
+
+Treasure = TypeVar('Treasure')
+
+
+class Sketch(QRunnable):
+
+    def __init__(self, limner: 'Limner', treasure: Treasure, size: int, key: tuple[int, int]):
+        super().__init__()
+        self.limner = limner
+        self.treasure = treasure
+        self.size = size
+        self.key = key
+
+    def run(self):
+        try:
+            image = self.treasure.to_image(self.size)
+        except OSError as err:
+            self.limner.logger.warning(f'Could not decode treasure {self.treasure.db_index}: {err}')
+            image = QImage()
+        finally:
+            self.limner.release(self.key)
+        SIGNALS.IMAGE_DECODED.emit(self.treasure.db_index, self.size, image)
+
+
+class Limner:
+    PLACEHOLDER_COLOR = QColor('lightgray')
+
+    def __init__(self):
+        self.pool = QThreadPool()
+        self.pending: set[tuple[int, int]] = set()
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def get_key(treasure: Treasure, size: int) -> tuple[int, int]:
+        return treasure.db_index or id(treasure), size
+
+    def get_placeholder(self, treasure: Treasure, size: int) -> QImage:
+        image_size = treasure.get_image_size() if treasure['type'] == 'image' else QSize()
+        if not image_size.isValid() or image_size.isEmpty():
+            image_size = QSize(size, size)
+        elif image_size.width() > size or image_size.height() > size:
+            image_size = image_size.scaled(size, size, Qt.KeepAspectRatio)
+        placeholder = QImage(image_size, QImage.Format_RGB32)
+        placeholder.fill(self.PLACEHOLDER_COLOR)
+        return placeholder
+
+    def release(self, key: tuple[int, int]):
+        with self.lock:
+            self.pending.discard(key)
+
+    def request(self, treasure: Treasure, size: int) -> QImage | None:
+        if treasure['type'] != 'image':
+            return treasure.to_image(size)
+        if treasure['uuid'] and (image := treasure.keep.gallery.peek(treasure['uuid'], size)) is not None:
+            return image
+        key = self.get_key(treasure, size)
+        with self.lock:
+            if key in self.pending:
+                return None
+            self.pending.add(key)
+        self.pool.start(Sketch(self, treasure, size, key))
+        return None
+
+    def stop(self):
+        self.pool.clear()
+        self.pool.waitForDone()
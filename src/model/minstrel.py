@@ -5,6 +5,7 @@ Keep = TypeVar('Keep')
 
 
 class Minstrel(Feature):
+    __slots__ = ()
     TABLE_NAME = 'minstrel'
     TAG_TABLE_NAME = 'genre'
     name: str
@@ -17,12 +18,10 @@ class Minstrel(Feature):
         return super().commit()
 
     def get_tags(self) -> list[str]:
-        df = self.keep.buildings['genre'].df
-        return df[df['_minstrel'] == self.db_index]['name'].values.tolist()
+        return self.keep.buildings['genre'].select('name', '_minstrel', self.db_index)
 
     def get_treasures(self) -> list[int]:
-        df = self.keep.buildings['repertoire'].df.sort_values(by='list_index')
-        return df[df['_minstrel'] == self.db_index]['_treasure'].values.tolist()
+        return self.keep.buildings['repertoire'].select('_treasure', '_minstrel', self.db_index, order_by='list_index')
 
     @property
     def icon_name(self) -> str:
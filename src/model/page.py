@@ -2,20 +2,19 @@ from .feature import Feature
 
 
 class Page(Feature):
+    __slots__ = ()
     TABLE_NAME = 'page'
+    RELATIONS = {'_book': 'cascade'}
     _book: int
     list_index: int
     name: str
     text: str
 
     def get_charts(self) -> list[int]:
-        df = self.keep.buildings['chart'].df.sort_values(by='list_index')
-        return df[df['_page'] == self.db_index]['_chart'].values.tolist()
+        return self.keep.buildings['chart'].select('_treasure', '_page', self.db_index, order_by='list_index')
 
     def get_footnotes(self) -> list[int]:
-        df = self.keep.buildings['footnote'].df.sort_values(by='list_index')
-        return df[df['_page'] == self.db_index]['_footnote'].values.tolist()
+        return self.keep.buildings['footnote'].select('_book', '_page', self.db_index, order_by='list_index')
 
     def get_sigils(self) -> list[int]:
-        df = self.keep.buildings['sigil'].df.sort_values(by='list_index')
-        return df[df['_page'] == self.db_index]['_sigil'].values.tolist()
+        return self.keep.buildings['sigil'].select('_encounter', '_page', self.db_index, order_by='list_index')
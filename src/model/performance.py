@@ -2,7 +2,9 @@ from .feature import Feature
 
 
 class Performance(Feature):
+    __slots__ = ()
     TABLE_NAME = 'performance'
+    RELATIONS = {'_minstrel': 'cascade', '_page': 'cascade'}
     _minstrel: int
     _page: int
     list_index: int
@@ -2,7 +2,9 @@ from .feature import Feature
 
 
 class Repertoire(Feature):
+    __slots__ = ()
     TABLE_NAME = 'repertoire'
+    RELATIONS = {'_minstrel': 'cascade', '_treasure': 'cascade'}
     _minstrel: int
     _treasure: int
     list_index: int
@@ -0,0 +1,128 @@
+import logging
+from pathlib import Path
+import queue
+import sqlite3
+import threading
+from typing import Any, ClassVar, NamedTuple
+
+from src.settings import SIGNALS
+
+
+class Snapshot(NamedTuple):
+    table_name: str
+    columns: tuple[str, ...]
+    deleted: tuple[int, ...]
+    rows: tuple[tuple[Any, ...], ...]
+    schema: tuple[str, ...] = ()
+
+
+class Scribe(threading.Thread):
+    ATTEMPTS: ClassVar[int] = 3
+
+    def __init__(self, path: Path):
+        super().__init__(name='Scribe', daemon=True)
+        self.path = path
+        self.failed: list[tuple[Snapshot, int]] = []
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.queue: queue.Queue[tuple[Snapshot, ...] | None] = queue.Queue()
+
+    def commit(self, connection: sqlite3.Connection, snapshots: tuple[Snapshot, ...]):
+        if not self.failed:
+            try:
+                with connection:
+                    connection.execute('BEGIN')
+                    for snapshot in snapshots:
+                        self.write(connection, snapshot)
+            except Exception as err:
+                self.logger.warning(f'Save failed, retrying tables one by one: {err!r}')
+            else:
+                if self.queue.empty():
+                    SIGNALS.SAVE_STATE.emit('flushed')
+                return
+        attempts = self.failed + [(snapshot, 0) for snapshot in snapshots]
+        self.failed = []
+        blocked = set()
+        rejected = False
+        for snapshot, attempt in attempts:
+            if snapshot.table_name in blocked:
+                self.failed.append((snapshot, attempt))
+                continue
+            try:
+                with connection:
+                    connection.execute('BEGIN')
+                    self.write(connection, snapshot)
+            except Exception as err:
+                if attempt + 1 < self.ATTEMPTS:
+                    self.logger.error(f'Save of {snapshot.table_name} failed: {err!r}')
+                    self.failed.append((snapshot, attempt + 1))
+                    blocked.add(snapshot.table_name)
+                else:
+                    rejected |= self.reject(connection, snapshot, err)
+        if self.failed or rejected:
+            SIGNALS.SAVE_STATE.emit('failed')
+        elif self.queue.empty():
+            SIGNALS.SAVE_STATE.emit('flushed')
+
+    def drain(self):
+        self.queue.join()
+
+    def reject(self, connection: sqlite3.Connection, snapshot: Snapshot, err: Exception) -> bool:
+        rejected = []
+        try:
+            with connection:
+                connection.execute('BEGIN')
+                self.write(connection, snapshot._replace(rows=()))
+                for row in snapshot.rows:
+                    connection.execute('SAVEPOINT row')
+                    try:
+                        self.write(connection, snapshot._replace(deleted=(), rows=(row,), schema=()))
+                    except Exception:
+                        connection.execute('ROLLBACK TO row')
+                        rejected.append(row[0])
+                    connection.execute('RELEASE row')
+        except Exception:
+            self.logger.error(f'Gave up saving {snapshot.table_name} after {self.ATTEMPTS} attempts ({err!r}): '
+                              f'rows {[row[0] for row in snapshot.rows]} and deletions {list(snapshot.deleted)} '
+                              f'are lost')
+            return True
+        if rejected:
+            self.logger.error(f'Gave up saving rows {rejected} of {snapshot.table_name} after {self.ATTEMPTS} '
+                              f'attempts ({err!r})')
+        return bool(rejected)
+
+    def run(self):
+        connection = sqlite3.connect(self.path)
+        connection.execute('PRAGMA journal_mode=WAL')
+        while (snapshots := self.queue.get()) is not None:
+            try:
+                self.commit(connection, snapshots)
+            finally:
+                self.queue.task_done()
+        while self.failed:
+            self.commit(connection, ())
+        connection.close()
+        self.queue.task_done()
+
+    def stop(self):
+        self.queue.put(None)
+        self.join()
+
+    def submit(self, snapshots: tuple[Snapshot, ...]):
+        if not snapshots:
+            return
+        SIGNALS.SAVE_STATE.emit('pending')
+        self.queue.put(snapshots)
+
+    @staticmethod
+    def write(connection: sqlite3.Connection, snapshot: Snapshot):
+        table_name = snapshot.table_name
+        if snapshot.schema:
+            connection.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+            for statement in snapshot.schema:
+                connection.execute(statement)
+        connection.executemany(f'DELETE FROM "{table_name}" WHERE _index = ?',
+                               ((db_index,) for db_index in snapshot.deleted))
+        column_string = ', '.join(f'"{column}"' for column in snapshot.columns)
+        placeholders = ', '.join('?' * len(snapshot.columns))
+        connection.executemany(f'INSERT OR REPLACE INTO "{table_name}" ({column_string}) VALUES ({placeholders})',
+                               snapshot.rows)
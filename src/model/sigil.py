@@ -2,7 +2,9 @@ from .feature import Feature
 
 
 class Sigil(Feature):
+    __slots__ = ()
     TABLE_NAME = 'sigil'
+    RELATIONS = {'_encounter': 'cascade', '_page': 'cascade'}
     _encounter: int
     _page: int
     list_index: int
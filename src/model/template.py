@@ -0,0 +1,115 @@
+import ast
+from functools import lru_cache
+import operator
+import re
+from typing import Callable, ClassVar, NamedTuple
+
+
+class Choice(NamedTuple):
+    options: tuple[str, ...]
+
+
+class Reference(NamedTuple):
+    name: str
+
+
+class Expression(NamedTuple):
+    prefix: str
+    tokens: tuple[str | Reference, ...]
+    format_: str
+    upper: bool
+
+
+class Gendered(NamedTuple):
+    parts: tuple[str | Choice, ...]
+
+
+class Template:
+    BINARY_OPERATORS: ClassVar[dict[type, Callable]] = {ast.Add: operator.add, ast.Sub: operator.sub,
+                                                        ast.Mult: operator.mul, ast.Div: operator.truediv,
+                                                        ast.FloorDiv: operator.floordiv, ast.Mod: operator.mod}
+    UNARY_OPERATORS: ClassVar[dict[type, Callable]] = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+    REGEX_BRACKET = re.compile(r'\[([^\]]*?)\]')
+    REGEX_GENDERED = re.compile(r'([^\/]*)\/([^\/]*)\/([^\/]*)')
+    REGEX_HTML = re.compile(r'<.*?>')
+    REGEX_ROLL = re.compile(r'(\d+d\d+)\s*?[+-]0')
+
+    def __init__(self, parts: tuple[str | Expression | Gendered, ...]):
+        self.parts = parts
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def calculate(cls, content: str, format_: str) -> str:
+        try:
+            return format(cls.evaluate(ast.parse(content, mode='eval')), format_)
+        except (SyntaxError, TypeError, ValueError, ZeroDivisionError):
+            return content
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def compile(cls, text: str, property_regex: re.Pattern) -> 'Template':
+        parts = []
+        position = 0
+        for match in cls.REGEX_BRACKET.finditer(text):
+            parts.append(text[position:match.start()])
+            parts.append(cls.compile_bracket(match[1], property_regex))
+            position = match.end()
+        parts.append(text[position:])
+        return cls(tuple(part for part in parts if part != ''))
+
+    @classmethod
+    def compile_bracket(cls, content: str, property_regex: re.Pattern) -> str | Expression | Gendered:
+        prefix = ''.join(cls.REGEX_HTML.findall(content))
+        content = cls.REGEX_HTML.sub('', content)
+        if cls.REGEX_GENDERED.search(content):
+            return Gendered(cls.split(content, cls.REGEX_GENDERED, lambda match: Choice(match.groups())))
+        content = content.replace(' ', '')
+        if not content:
+            return ''
+        return Expression(prefix=prefix,
+                          tokens=cls.split(content, property_regex, lambda match: Reference(match[1].lower())),
+                          format_='+d' if content[0] in ('+', '-') else '', upper=content[0].isupper())
+
+    @classmethod
+    def evaluate(cls, node: ast.AST) -> int | float:
+        match node:
+            case ast.Expression(body=body):
+                return cls.evaluate(body)
+            case ast.Constant(value=value) if type(value) in (int, float):
+                return value
+            case ast.BinOp(left=left, op=op, right=right) if type(op) in cls.BINARY_OPERATORS:
+                return cls.BINARY_OPERATORS[type(op)](cls.evaluate(left), cls.evaluate(right))
+            case ast.UnaryOp(op=op, operand=operand) if type(op) in cls.UNARY_OPERATORS:
+                return cls.UNARY_OPERATORS[type(op)](cls.evaluate(operand))
+        raise ValueError(f'Unsupported expression: {ast.dump(node)}')
+
+    def render(self, resolve: Callable[[str], str], gender: int) -> str:
+        result = []
+        for part in self.parts:
+            match part:
+                case str():
+                    result.append(part)
+                case Gendered(parts=parts):
+                    result.extend(p if isinstance(p, str) else p.options[gender] for p in parts)
+                case Expression():
+                    result.append(self.render_expression(part, resolve))
+        return self.REGEX_ROLL.sub(lambda match: match[1], ''.join(result))
+
+    @classmethod
+    def render_expression(cls, expression: Expression, resolve: Callable[[str], str]) -> str:
+        content = ''.join(token if isinstance(token, str) else resolve(token.name) for token in expression.tokens)
+        result = cls.calculate(content, expression.format_)
+        if expression.upper:
+            result = result.capitalize()
+        return expression.prefix + result
+
+    @staticmethod
+    def split(content: str, regex: re.Pattern, convert: Callable[[re.Match], Choice | Reference]) -> tuple:
+        parts = []
+        position = 0
+        for match in regex.finditer(content):
+            parts.append(content[position:match.start()])
+            parts.append(convert(match))
+            position = match.end()
+        parts.append(content[position:])
+        return tuple(part for part in parts if part != '')
@@ -2,6 +2,9 @@ from .feature import Feature
 
 
 class Trait(Feature):
+    __slots__ = ()
     TABLE_NAME = 'trait'
+    RELATIONS = {'_guard': 'cascade'}
+    CATEGORIES = ('name',)
     _guard: int
     name: str
@@ -1,22 +1,20 @@
-import io
 import os
 from pathlib import Path
 import re
 import shutil
 from typing import TypeVar
-import uuid
 
-import pandas as pd
-from PySide2.QtCore import QBuffer, QByteArray, QMimeData, QUrl
-from PySide2.QtGui import QImage
-import requests
+from PySide2.QtCore import QBuffer, QByteArray, QMimeData, QSize, Qt, QUrl
+from PySide2.QtGui import QImage, QImageReader
 
+from .digest import Digest
 from .feature import Feature
 from src.settings import PATHS
 Keep = TypeVar('Keep')
 
 
 class Treasure(Feature):
+    __slots__ = ('_bytes', '_source', '_uuid')
     IMAGE_FORMATS = ('.png', '.jpg', '.jpeg', '.webp', '.bmp', '.svg', '.gif')
     MUSIC_FORMATS = ('.mp3', '.wav', '.avi', '.mp4', '.m4a', '.webm')
     WORD_FORMATS = ('.doc', '.docx', '.docm')
@@ -26,6 +24,7 @@ class Treasure(Feature):
                                r'(/(?:[\w\-]+\?v=|embed/|live/|v/)?)([\w\-]+)(\S+)?$')
     TABLE_NAME = 'treasure'
     TAG_TABLE_NAME = 'inscription'
+    CATEGORIES = ('suffix', 'type')
     info: str
     inscriptions: str   # set in self.commit
     name: str
@@ -38,10 +37,12 @@ class Treasure(Feature):
     def __init__(self, keep: Keep, db_index: int = 0, data: dict = None):
         super().__init__(keep=keep, db_index=db_index, data=data, )
         self._bytes = b''
+        self._source: Path | None = None
+        self._uuid = ''
 
     @property
     def bytes(self):
-        return self._bytes or self.path.read_bytes()
+        return self._bytes or (self._source or self.path).read_bytes()
 
     def commit(self) -> int:
         self['text'] = self['text'].strip()
@@ -49,45 +50,37 @@ class Treasure(Feature):
         self.localize(False)
         return super().commit()
 
+    def decode_image(self, size: int | None = None) -> QImage:
+        buffer = QBuffer()
+        reader = self.get_image_reader(buffer)
+        if size and (original := reader.size()).isValid() and (original.width() > size or original.height() > size):
+            reader.setScaledSize(original.scaled(size, size, Qt.KeepAspectRatio))
+        return reader.read()
+
     def find_usage(self) -> str:
         buildings = self.keep.buildings
-        thumbnails = (df := buildings['book'].df)[df['_treasure'] == self.db_index]['name'].values.tolist()
-        guards = (df := buildings['guard'].df)[df['_treasure'] == self.db_index]['name'].values.tolist()
-        books = pd.read_sql(f'''SELECT
-                                t.name 'treasure_name',
-                                b.name 'book_name',
-                                p.name 'page_name'
-                                FROM
-                                treasure t
-                                INNER JOIN chart c ON c._treasure = t._index
-                                INNER JOIN page p ON p._index = c._page
-                                INNER JOIN book b ON b._index = p._book
-                                AND t._index = {self.db_index}''', self.keep.connection)
-        minstrels = pd.read_sql(f'''SELECT t.name 'treasure_name',
-                                    m.name 'minstrel_name'
-                                    FROM treasure t
-                                    INNER JOIN repertoire r ON t._index = r._treasure
-                                    INNER JOIN minstrel m ON r._minstrel = m._index
-                                    WHERE t._index = {self.db_index}''', self.keep.connection)
+        references = self.keep.get_references(self.TABLE_NAME, self.db_index)
         results = []
         if self.keep.treasure_index == self.db_index:
             results.append('The Treasure is used as the thumbnail for this Keep.')
-        if thumbnails:
+        if thumbnails := [buildings['book'].get_value(db_index, 'name') for db_index in references.get('book', ())]:
             results.append('The Treasure is used as the thumbnail for the following books:\n' +
                            '\n'.join(f'• {thumbnail}' for thumbnail in thumbnails))
-        if guards:
+        if guards := [buildings['guard'].get_value(db_index, 'name') for db_index in references.get('guard', ())]:
             results.append('The Treasure is used as the image for the following guards:\n' +
                            '\n'.join(f'• {guard}' for guard in guards))
-        if not books.empty:
-            def _add_reference(series: pd.Series):
-                return f'• {series["book_name"]} (p. {series["page_name"]})'
-            results.append('The Treasure is referenced in the following books:\n' +
-                           '\n'.join(books.apply(_add_reference, axis=1).values.tolist()))
-        if not minstrels.empty:
-            def _add_reference(series: pd.Series):
-                return f'• {series["minstrel_name"]}'
+        books = []
+        for page_index in (buildings['chart'].get_value(db_index, '_page') for db_index in references.get('chart', ())):
+            book_index = buildings['page'].get_value(page_index, '_book')
+            books.append(f'• {buildings["book"].get_value(book_index, "name")} '
+                         f'(p. {buildings["page"].get_value(page_index, "name")})')
+        if books:
+            results.append('The Treasure is referenced in the following books:\n' + '\n'.join(books))
+        minstrel_indices = (buildings['repertoire'].get_value(db_index, '_minstrel')
+                            for db_index in references.get('repertoire', ()))
+        if minstrels := [buildings['minstrel'].get_value(db_index, 'name') for db_index in minstrel_indices]:
             results.append('The Treasure is performed by the following minstrels:\n' +
-                           '\n'.join(minstrels.apply(_add_reference, axis=1).values.tolist()))
+                           '\n'.join(f'• {minstrel}' for minstrel in minstrels))
         return '\n\n'.join(results)
 
     def get_html(self) -> str:
@@ -106,24 +99,49 @@ class Treasure(Feature):
             case 'python': return 'code'
             case _: return 'document_empty'
 
+    def get_image_reader(self, buffer: QBuffer) -> QImageReader:
+        if not self._bytes:
+            return QImageReader((self._source or self.path).as_posix().__str__())
+        buffer.setData(QByteArray(self._bytes))
+        return QImageReader(buffer)
+
+    def get_image_size(self) -> QSize:
+        if self['uuid'] and not self._bytes and not self._source:
+            return self.keep.gallery.get_dimensions(self['uuid'], self.read_image_size)
+        return self.read_image_size()
+
     def get_tags(self) -> list[str]:
-        df = self.keep.buildings['inscription'].df
-        return df[df['_treasure'] == self.db_index]['name'].values.tolist()
+        return self.keep.buildings['inscription'].select('name', '_treasure', self.db_index)
 
     @classmethod
     def get_uuid_from_bytes(cls, b: bytes) -> str:
-        return uuid.uuid5(uuid.NAMESPACE_URL, b.hex()).hex
+        digest = Digest()
+        digest.update_bytes(b)
+        return digest.uuid
+
+    @classmethod
+    def get_uuid_from_path(cls, path: str | os.PathLike[str]) -> str:
+        digest = Digest()
+        digest.update_file(path)
+        return digest.uuid
 
     @property
     def icon_name(self) -> str:
         return self.get_icon_name(self['type'])
 
+    def is_used(self) -> bool:
+        return self.keep.treasure_index == self.db_index or self.keep.is_referenced(self.TABLE_NAME, self.db_index)
+
     def localize(self, overwrite: bool = False):
         if ':' in self['suffix']:
             return
         self['uuid'] = self.uuid
         if not self.path.exists() or overwrite:
-            self.path.write_bytes(self.bytes)
+            self.keep.gallery.discard(self.uuid)
+            if self._bytes:
+                self.path.write_bytes(self._bytes)
+            elif self._source and self._source != self.path:
+                shutil.copyfile(self._source, self.path)
         self['size'] = self.path.stat().st_size
 
     @property
@@ -141,6 +159,10 @@ class Treasure(Feature):
             return [cls.read_mime_data(keep, mime) for mime in mimes]
         return [cls.read_mime_data(keep, data)]
 
+    def read_image_size(self) -> QSize:
+        buffer = QBuffer()
+        return self.get_image_reader(buffer).size()
+
     @classmethod
     def read_mime_data(cls, keep: Keep, data: QMimeData):
         if data.hasFormat('lorekeeper/treasure'):
@@ -196,7 +218,7 @@ class Treasure(Feature):
             treasure['info'] = f'PNG Image: {"x".join(map(str, image.size().toTuple()))}'
         else:
             treasure['info'] = 'Local File'
-        treasure.set_bytes(path.read_bytes())
+        treasure.set_source(path)
         return treasure
 
     @classmethod
@@ -205,28 +227,35 @@ class Treasure(Feature):
         if suffix not in cls.IMAGE_FORMATS:
             return None
         try:
-            with requests.get(url, stream=True) as answer:
-                with io.BytesIO() as content:
-                    treasure = Treasure.new(keep)
-                    shutil.copyfileobj(answer.raw, content)
-                    treasure.set_bytes(content.getvalue())
-                    treasure['type'] = 'image'
-                    treasure['suffix'] = suffix
-                    treasure['name'] = url.rsplit('/', 1)[-1]
-                    treasure['info'] = url
-                    return treasure
+            delivery = keep.courier.deliver(url)
         except Exception as err:
             if silent:
                 return None
             raise err
+        treasure = Treasure.new(keep)
+        treasure.set_source(delivery.path, delivery.uuid)
+        treasure['type'] = 'image'
+        treasure['suffix'] = suffix
+        treasure['name'] = url.rsplit('/', 1)[-1]
+        treasure['info'] = url
+        return treasure
 
-    def set_bytes(self, b: bytes):
+    def set_bytes(self, b: bytes, uuid_: str = ''):
         self._bytes = b
+        self._source = None
+        self._uuid = uuid_
+
+    def set_source(self, path: Path, uuid_: str = ''):
+        self._bytes = b''
+        self._source = path
+        self._uuid = uuid_
 
-    def to_image(self) -> QImage:
-        if self['type'] == 'image':
-            return QImage.fromData(QByteArray(self.bytes))
-        return QImage(PATHS['icons'].joinpath(self.icon_name).as_posix().__str__())
+    def to_image(self, size: int | None = None) -> QImage:
+        if self['type'] != 'image':
+            return super().to_image(size)
+        if size and self['uuid'] and self.keep.gallery.get_fixed_size(size):
+            return self.keep.gallery.get(self['uuid'], size, lambda: self.decode_image(self.keep.gallery.SIZES[-1]))
+        return self.decode_image(size)
 
     @property
     def type_(self) -> str:
@@ -243,4 +272,8 @@ class Treasure(Feature):
 
     @property
     def uuid(self) -> str:
-        return self['uuid'] or self.get_uuid_from_bytes(self._bytes)
+        if self['uuid']:
+            return self['uuid']
+        if not self._uuid:
+            self._uuid = self.get_uuid_from_path(self._source) if self._source else self.get_uuid_from_bytes(self._bytes)
+        return self._uuid
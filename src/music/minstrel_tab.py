@@ -1,5 +1,6 @@
 import random
 
+import pandas as pd
 from PySide2 import QtCore, QtGui, QtMultimedia, QtWidgets
 
 from src.model import Genre, Keep, Minstrel, Repertoire, Treasure
@@ -14,7 +15,6 @@ class MinstrelTab(QtWidgets.QWidget):
         super().__init__(parent=parent)
         self.keep = keep
         self.db_index = db_index
-        self.df = self.keep.buildings['treasure'].df
         self.minstrel = Minstrel.read_keep(keep, db_index)
         self.feature_preview = None
         self._playlist = QtMultimedia.QMediaPlaylist(self)
@@ -115,17 +115,17 @@ class MinstrelTab(QtWidgets.QWidget):
 
     def delete_genres(self):
         genre = self.keep.buildings['genre']
-        df = genre.df
-        df.drop(df[df['_minstrel'] == self.db_index].index, inplace=True)
-        genre.reset_columns()
-        genre.save(False)
+        genre.drop_where('_minstrel', self.db_index)
+        genre.save()
 
     def delete_repertoire(self):
         repertoire = self.keep.buildings['repertoire']
-        df = repertoire.df
-        df.drop(df[df['_minstrel'] == self.db_index].index, inplace=True)
-        repertoire.reset_columns()
-        repertoire.save(False)
+        repertoire.drop_where('_minstrel', self.db_index)
+        repertoire.save()
+
+    @property
+    def df(self) -> pd.DataFrame:
+        return self.keep.buildings['treasure'].df
 
     def dragEnterEvent(self, event: QtGui.QDragEnterEvent):
         drop_object = Treasure.read_mime_data(self.keep, event.mimeData())
@@ -191,7 +191,7 @@ class MinstrelTab(QtWidgets.QWidget):
         self.tag_frame.set_tags(self.minstrel.get_tags())
 
     def load_repertoire(self):
-        for treasure in self.minstrel.get_treasures():
+        for treasure in self.keep.buildings['treasure'].read_many(self.minstrel.get_treasures()):
             self.add_treasure(treasure, commit=False)
 
     def mouseMoveEvent(self, event: QtGui.QMouseEvent):
@@ -318,7 +318,7 @@ class MinstrelTab(QtWidgets.QWidget):
         self.delete_repertoire()
         for row in range(self._container.count()):
             Repertoire(self.keep, data={'_minstrel': self.db_index, '_treasure': self.get_db_index(row),
-                                        '_index': row}).commit()
+                                        'list_index': row}).commit()
         self.minstrel.commit()
 
     def shuffle(self):
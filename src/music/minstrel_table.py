@@ -1,7 +1,6 @@
-import pandas as pd
 from PySide2 import QtCore, QtGui, QtWidgets
 
-from src.model import Keep, Minstrel
+from src.model import Feature, Keep, Minstrel
 from src.settings import SIGNALS
 from src.widgets import BuildingTable, Icon, RenameAction, RenameDialog
 
@@ -13,9 +12,8 @@ class MinstrelTable(BuildingTable):
         super().__init__(keep=keep, feature_type=Minstrel, parent=parent)
         self.search_black_list: tuple[str, ...] = ()
         self.search_white_list: tuple[str, ...] = ()
-        self.genre_df = keep.buildings['genre'].df
         self.row_num = None
-        self.reload_data()
+        self.reload_header()
 
     def contextMenuEvent(self, event: QtGui.QContextMenuEvent):
         context_menu = QtWidgets.QMenu(self)
@@ -47,36 +45,35 @@ class MinstrelTable(BuildingTable):
                 return True
         super().keyPressEvent(event)
 
-    def load_series(self, series: pd.Series, row: int | None = None):
+    def load_feature(self, feature: Feature, row: int | None = None):
         self.blockSignals(True)
         new_row = row is None
         if new_row:
             row = self.row_num
-        series = series.copy(False)
-        db_index = int(series.name)  # noqa
-        name_item = QtWidgets.QTableWidgetItem(series['name'])
+        db_index = feature.db_index
+        name_item = QtWidgets.QTableWidgetItem(feature['name'])
         name_item.setData(QtCore.Qt.UserRole, db_index)
         name_item.setFlags(name_item.flags() & ~QtCore.Qt.ItemIsEditable)
         hidden_item = QtWidgets.QWidget()
         hidden_layout = QtWidgets.QHBoxLayout()
         hidden_box = QtWidgets.QCheckBox()
-        hidden_box.setChecked(series['state'] != 0)
+        hidden_box.setChecked(feature['state'] != 0)
         hidden_box.stateChanged.connect(lambda state: self.on_check(db_index, state))
         hidden_layout.addWidget(hidden_box)
         hidden_layout.setAlignment(QtCore.Qt.AlignCenter)
         hidden_layout.setContentsMargins(0, 0, 0, 0)
         hidden_item.setLayout(hidden_layout)
 
-        genres_item = QtWidgets.QTableWidgetItem(series['genres'])
+        genres_item = QtWidgets.QTableWidgetItem(feature['genres'])
         genres_item.setFlags(genres_item.flags() & ~QtCore.Qt.ItemIsEditable)
         genres_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-        count_item = QtWidgets.QTableWidgetItem(str(series['count']))
+        count_item = QtWidgets.QTableWidgetItem(str(feature['count']))
         count_item.setFlags(count_item.flags() & ~QtCore.Qt.ItemIsEditable)
         count_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-        created_item = QtWidgets.QTableWidgetItem(series['_created'])
+        created_item = QtWidgets.QTableWidgetItem(feature.get_text('_created'))
         created_item.setFlags(created_item.flags() & ~QtCore.Qt.ItemIsEditable)
         created_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-        modified_item = QtWidgets.QTableWidgetItem(series['_modified'])
+        modified_item = QtWidgets.QTableWidgetItem(feature.get_text('_modified'))
         modified_item.setFlags(modified_item.flags() & ~QtCore.Qt.ItemIsEditable)
         modified_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
 
@@ -106,15 +103,18 @@ class MinstrelTable(BuildingTable):
         self.clear()
         self.setRowCount(len(self.df.index))
         self.row_num = 0
-        self.setColumnCount(6)
-        self.setHorizontalHeaderLabels(['Minstrel', 'Show', '#', 'Created', 'Last Modified', 'Genres'])
-        if not self.df.empty:
-            self.df.apply(self.load_series, axis=1)
+        self.reload_header()
+        for feature in self.building.read_many():
+            self.load_feature(feature)
         self.verticalHeader().setVisible(False)
         self.horizontalHeader().resizeSection(1, 20)
         self.resizeColumnsToContents()
         self.resizeRowsToContents()
 
+    def reload_header(self):
+        self.setColumnCount(6)
+        self.setHorizontalHeaderLabels(['Minstrel', 'Show', '#', 'Created', 'Last Modified', 'Genres'])
+
     def refresh_hidden(self):
         for row in range(self.rowCount()):
             search_string = self.item(row, 0).text().lower() + ', ' + self.item(row, 5).text().lower()
@@ -19,7 +19,6 @@ class MusicHall(BuildingWindow):
         self.setWindowIcon(Icon('clef'))
         self.setWindowTitle('Music Hall - Lorekeeper')
         self.keep = keep
-        self.df = keep.buildings['minstrel'].df
         self.tab_view = QtWidgets.QTabWidget()
         self.setCentralWidget(self.frame)
         self.tab_view.setTabsClosable(True)
@@ -59,7 +58,6 @@ class MusicHall(BuildingWindow):
         SIGNALS.MINSTREL_COMMIT.connect(self.save)
         SIGNALS.MINSTREL_INSPECT.connect(self.on_minstrel_inspect)
         SIGNALS.MINSTREL_DELETE.connect(self.on_minstrel_delete)
-        SIGNALS.MINSTREL_DELETE.connect(self.save)
         SIGNALS.TAB_RENAME.connect(self.on_minstrel_rename)
         self.tab_view.tabCloseRequested.connect(self.on_tab_close)
         self.toolbar.STRING.connect(self.minstrel_table.toolbar_set_search)
@@ -77,6 +75,10 @@ class MusicHall(BuildingWindow):
         tab.stop()
         self.tab_view.removeTab(index)
 
+    @property
+    def df(self) -> pd.DataFrame:
+        return self.keep.buildings['minstrel'].df
+
     def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
         if watched == self.tab_view.tabBar() and event.type() == QtCore.QEvent.MouseButtonPress and \
                 event.buttons() == QtCore.Qt.RightButton:
@@ -104,7 +106,7 @@ class MusicHall(BuildingWindow):
         index, tab = self.get_tab(db_index)
 
         try:
-            series = self.df.loc[db_index]
+            series = self.keep.buildings['minstrel'].get_row(db_index)
         except KeyError:
             if tab:
                 self.tab_view.removeTab(index)
@@ -133,11 +135,6 @@ class MusicHall(BuildingWindow):
 
     def on_minstrel_delete(self, db_index: int):
         self.delete_tab(db_index)
-        for building_name in ('genre', 'repertoire', 'performance'):
-            building = self.keep.buildings[building_name]
-            building.df.drop(building.df[building.df['_minstrel'] == db_index].index, inplace=True)
-            building.reset_columns()
-            building.save(False)
 
     def on_minstrel_inspect(self, db_index):
         minstrel = Minstrel.read_keep(self.keep, db_index=db_index)
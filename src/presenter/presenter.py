@@ -21,13 +21,23 @@ class BoxedImage(QtWidgets.QLabel):
     def __init__(self, db_index: int, parent: QtWidgets.QWidget | None = None):
         super().__init__(parent)
         self.db_index = db_index
+        self.max_width = 0
+        self.max_height = 0
+        self.requested_size = 0
         self.setSizePolicy(QtWidgets.QSizePolicy.Ignored, QtWidgets.QSizePolicy.Ignored)
 
     @classmethod
     def from_image(cls, image: QtGui.QImage, db_index: int, max_width: int, max_height: int,
                    parent: QtWidgets.QWidget | None = None):
         label = cls(db_index, parent)
-        size = QtCore.QSize(min(image.width(), max_width) - 4, min(image.height(), max_height) - 4)
+        label.max_width = max_width
+        label.max_height = max_height
+        label.set_image(image)
+        label.setStyleSheet('QLabel{border: 2px solid black;background-colo: white};')
+        return label
+
+    def set_image(self, image: QtGui.QImage):
+        size = QtCore.QSize(min(image.width(), self.max_width) - 4, min(image.height(), self.max_height) - 4)
         image = image.scaled(size, QtCore.Qt.KeepAspectRatio)
         background = QtGui.QImage(image.size(), QtGui.QImage.Format_ARGB32)
         background.fill(QtGui.QColor('white').rgb())
@@ -35,10 +45,8 @@ class BoxedImage(QtWidgets.QLabel):
         painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
         painter.drawImage(0, 0, image)
         painter.end()
-        label.resize(image.width(), image.height())
-        label.setPixmap(QtGui.QPixmap.fromImage(background))
-        label.setStyleSheet('QLabel{border: 2px solid black;background-colo: white};')
-        return label
+        self.resize(image.width(), image.height())
+        self.setPixmap(QtGui.QPixmap.fromImage(background))
 
 
 class Presenter(BuildingWindow):
@@ -72,6 +80,7 @@ class Presenter(BuildingWindow):
         SIGNALS.PRESENTER_BACKGROUND.connect(lambda db_index: self.set_background(db_index))
         SIGNALS.PRESENTER_REMOVE.connect(lambda db_index: self.remove_image(db_index))
         SIGNALS.TREASURE_DELETE.connect(self.on_delete_treasure)
+        SIGNALS.IMAGE_DECODED.connect(self.on_image_decoded)
         SIGNALS.REFRESH.connect(self.on_refresh)
         self.on_refresh()
 
@@ -164,6 +173,13 @@ class Presenter(BuildingWindow):
             self.set_background(0)
         self.reload_images()
 
+    def on_image_decoded(self, db_index: int, size: int, image: QtGui.QImage):
+        for index in range(self.image_layout.count()):
+            boxed_image = self.image_layout.itemAt(index).widget()
+            if isinstance(boxed_image, BoxedImage) and boxed_image.db_index == db_index and \
+                    boxed_image.requested_size == size:
+                boxed_image.set_image(image)
+
     def on_refresh(self):
         encounter_data = None
         for widget in QtWidgets.QApplication.topLevelWidgets():
@@ -182,8 +198,8 @@ class Presenter(BuildingWindow):
         self.resize_timer.stop()
         self.clear_layout(self.image_layout)
         self.encounter_widget.updateGeometry()
-        db_images = [(treasure.db_index, treasure.to_image()) for treasure in self.treasures]
-        db_images.sort(key=lambda img: img[1].height() / img[1].width(), reverse=True)
+        db_images = [(treasure, treasure.get_image_size()) for treasure in self.treasures]
+        db_images.sort(key=lambda img: img[1].height() / max(img[1].width(), 1), reverse=True)
         width, height = self.size().toTuple()
         spacing = self.layout().spacing()
         height -= 2 * spacing
@@ -192,7 +208,7 @@ class Presenter(BuildingWindow):
         rows = 1 + (total >= 3)
         columns = (total + 1) // 2 + (total == 2)
 
-        for index, (db_index, image) in enumerate(db_images, start=1):
+        for index, (treasure, _) in enumerate(db_images, start=1):
             box_width = width // columns - (columns + 1) * spacing
             box_row = 1 + (index > (total % 2) + total // 2) - int(total == index == 2)
             if box_row == 1:
@@ -205,7 +221,12 @@ class Presenter(BuildingWindow):
             else:
                 box_height = height // rows - 2 * spacing
                 row_span = 1
-            boxed_image = BoxedImage.from_image(image, db_index=db_index, max_width=box_width, max_height=box_height)
+            requested_size = max(box_width, box_height)
+            if (image := self.keep.limner.request(treasure, requested_size)) is None:
+                image = self.keep.limner.get_placeholder(treasure, requested_size)
+            boxed_image = BoxedImage.from_image(image, db_index=treasure.db_index, max_width=box_width,
+                                                max_height=box_height)
+            boxed_image.requested_size = requested_size
             boxed_image.installEventFilter(self)
             self.image_layout.addWidget(boxed_image, box_row, box_column, row_span, 1, QtCore.Qt.AlignCenter)
 
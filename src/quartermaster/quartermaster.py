@@ -48,6 +48,7 @@ class Quartermaster(BuildingWindow):
 
     def execute(self):
         query = self.query_edit.toPlainText()
+        self.keep.scribe.drain()
         try:
             result = pd.read_sql(query, self.keep.connection).copy()
         except TypeError:
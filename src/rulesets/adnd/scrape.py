@@ -93,11 +93,13 @@ def import_monsters(keep: Keep, books: str | Collection[str] = 'add2_01/2102'):
                                                                                                 for book in books)))))
         data_path.write_text(json.dumps(data))
     SIGNALS.PROGRESS_RANGE.emit(0, len(data) - 1)
-    for index, monster_result in enumerate(data):
-        for monster in monster_result:
-            guard = ADnD.GUARD_TYPE(keep)
-            for key, val in monster.items():
-                guard[key] = html.unescape(str(val))
-            guard.commit()
-        SIGNALS.PROGRESS_SET.emit(index)
-    #    time.sleep(.4)
+    guard_indices = iter(keep.buildings['guard'].reserve(sum(map(len, data))))
+    with keep.batch():
+        for index, monster_result in enumerate(data):
+            for monster in monster_result:
+                guard = ADnD.GUARD_TYPE(keep, db_index=next(guard_indices))
+                for key, val in monster.items():
+                    guard[key] = html.unescape(str(val))
+                guard.commit()
+            SIGNALS.PROGRESS_SET.emit(index)
+        #    time.sleep(.4)
@@ -2,6 +2,7 @@ from src.model import Combatant, Guard as BasicGuard, Keep
 
 
 class Guard(BasicGuard):
+    __slots__ = ()
     name: str
     _treasure: int
     short_name: str
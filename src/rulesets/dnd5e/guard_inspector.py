@@ -263,10 +263,8 @@ class GuardInspector(QtWidgets.QMainWindow):
 
     def delete_traits(self):
         trait = self.keep.buildings['trait']
-        df = trait.df
-        df.drop(df[df['_guard'] == self.guard.db_index].index, inplace=True)
-        trait.reset_columns()
-        trait.save(False)
+        trait.drop_where('_guard', self.guard.db_index)
+        trait.save()
 
     def get_ability_modifier(self, ability: str) -> int:
         return int(self.ability_edits[ability].get() - 10) // 2
@@ -416,7 +414,7 @@ class GuardInspector(QtWidgets.QMainWindow):
         db_index = self.guard.db_index
         for tag_name in self.tag_frame.tags:
             Trait(keep, data={'_guard': db_index, 'name': tag_name}).commit()
-        keep.buildings['trait'].save(False)
+        keep.buildings['trait'].save()
 
     def set_modified(self, value: bool = True):
         self._is_modified = value
@@ -82,29 +82,32 @@ def read_entry(entry: dict) -> tuple[str | None, dict[str, str | int]]:
 def import_monsters(keep: Keep, count: int | None = None, download_images: bool = True):
     entry_list = get_data()
     SIGNALS.PROGRESS_RANGE.emit(0, len(entry_list) - 1)
-    for index, entry in enumerate(entry_list):
-        if count and index >= count:
-            break
-        try:
-            url, data = read_entry(entry)
-            if download_images and url:
-                treasure = Treasure.read_url(keep, url)
-                if treasure:
-                    treasure['name'] = data['name']
-                    data['_treasure'] = treasure.commit()
-                    inscription = Inscription(keep)
-                    inscription['name'] = 'Monster Manual'
-                    inscription['_treasure'] = treasure.db_index
-                    inscription.commit()
-        except Exception as err:
-            print(err, entry)
-            continue
-        else:
-            guard = RULESET.GUARD_TYPE.new(keep)
-            guard.update(data)
-            trait = Trait(keep)
-            trait['name'] = 'Monster Manual'
-            trait['_guard'] = guard.commit()
-            trait.commit()
-        finally:
-            SIGNALS.PROGRESS_SET.emit(index)
+    guard_indices = iter(keep.buildings['guard'].reserve(min(count or len(entry_list), len(entry_list))))
+    with keep.batch():
+        for index, entry in enumerate(entry_list):
+            if count and index >= count:
+                break
+            try:
+                url, data = read_entry(entry)
+                if download_images and url:
+                    treasure = Treasure.read_url(keep, url)
+                    if treasure:
+                        treasure['name'] = data['name']
+                        data['_treasure'] = treasure.commit()
+                        inscription = Inscription(keep)
+                        inscription['name'] = 'Monster Manual'
+                        inscription['_treasure'] = treasure.db_index
+                        inscription.commit()
+            except Exception as err:
+                print(err, entry)
+                continue
+            else:
+                guard = RULESET.GUARD_TYPE.new(keep)
+                guard.db_index = next(guard_indices)
+                guard.update(data)
+                trait = Trait(keep)
+                trait['name'] = 'Monster Manual'
+                trait['_guard'] = guard.commit()
+                trait.commit()
+            finally:
+                SIGNALS.PROGRESS_SET.emit(index)
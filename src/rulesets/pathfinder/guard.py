@@ -2,6 +2,7 @@ from src.model import Combatant, Guard as BasicGuard, Keep
 
 
 class Guard(BasicGuard):
+    __slots__ = ()
     name: str
     short_name: str
     traits: str
@@ -174,10 +174,8 @@ class GuardInspector(QtWidgets.QMainWindow):
 
     def delete_traits(self):
         trait = self.keep.buildings['trait']
-        df = trait.df
-        df.drop(df[df['_guard'] == self.guard.db_index].index, inplace=True)
-        trait.reset_columns()
-        trait.save(False)
+        trait.drop_where('_guard', self.guard.db_index)
+        trait.save()
 
     @property
     def is_modified(self) -> bool:
@@ -284,7 +282,7 @@ class GuardInspector(QtWidgets.QMainWindow):
         db_index = self.guard.db_index
         for tag_name in self.tag_frame.tags:
             Trait(keep, data={'_guard': db_index, 'name': tag_name}).commit()
-        keep.buildings['trait'].save(False)
+        keep.buildings['trait'].save()
 
     def set_modified(self, value: bool = True):
         self._is_modified = value
@@ -122,30 +122,33 @@ def import_monsters(keep: Keep, count: int = None, download_images: bool = True)
         aon_data_list = list(filter(None, (read_aon(index) for index in range(5))))
         data_path.write_text(json.dumps(aon_data_list))
     SIGNALS.PROGRESS_RANGE.emit(0, len(aon_data_list) - 1)
-    for index, aon_data in enumerate(aon_data_list):
-        SIGNALS.PROGRESS_SET.emit(index)
-        image_url = aon_data.pop('_image')
-        if download_images and image_url:
-            treasure = Treasure.read_url(keep, image_url)
-            if treasure:
-                treasure['name'] = aon_data['name']
-                aon_data['_treasure'] = treasure.commit()
-                inscription_aon = Inscription(keep)
-                inscription_aon['name'] = 'Archives of Nethys'
-                inscription_aon['_treasure'] = treasure.db_index
-                inscription_aon.commit()
-                inscription_hidden = Inscription(keep)
-                inscription_hidden['name'] = '_hidden'
-                inscription_hidden['_treasure'] = treasure.db_index
-                inscription_hidden.commit()
-                treasure.commit()
-        guard = Guard.new(keep)
-        guard.update(aon_data)
-        guard_index = guard.commit()
-        while aon_data['_traits']:
-            trait = Trait(keep)
-            trait['name'] = aon_data['_traits'].pop(0)
-            trait['_guard'] = guard_index
-            trait.commit()
-        if count and index >= count:
-            break
+    guard_indices = iter(keep.buildings['guard'].reserve(len(aon_data_list)))
+    with keep.batch():
+        for index, aon_data in enumerate(aon_data_list):
+            SIGNALS.PROGRESS_SET.emit(index)
+            image_url = aon_data.pop('_image')
+            if download_images and image_url:
+                treasure = Treasure.read_url(keep, image_url)
+                if treasure:
+                    treasure['name'] = aon_data['name']
+                    aon_data['_treasure'] = treasure.commit()
+                    inscription_aon = Inscription(keep)
+                    inscription_aon['name'] = 'Archives of Nethys'
+                    inscription_aon['_treasure'] = treasure.db_index
+                    inscription_aon.commit()
+                    inscription_hidden = Inscription(keep)
+                    inscription_hidden['name'] = '_hidden'
+                    inscription_hidden['_treasure'] = treasure.db_index
+                    inscription_hidden.commit()
+                    treasure.commit()
+            guard = Guard.new(keep)
+            guard.db_index = next(guard_indices)
+            guard.update(aon_data)
+            guard_index = guard.commit()
+            while aon_data['_traits']:
+                trait = Trait(keep)
+                trait['name'] = aon_data['_traits'].pop(0)
+                trait['_guard'] = guard_index
+                trait.commit()
+            if count and index >= count:
+                break
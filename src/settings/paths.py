@@ -11,6 +11,7 @@ PATHS: dict[str, Path] = dict(
     rulesets=Path('src', 'rulesets'),
     scrape=Path('media', 'scrape'),
     settings=Path('settings.toml'),
+    thumbnails=None,
     tokens=Path('media', 'tokens'),
     workbench=None
 )
@@ -7,6 +7,7 @@ class SignalManager(QObject):
     BOOK_COMMIT = Signal(int)                   # db_index
     BOOK_DELETE = Signal(int)                   # db_index
     BOOK_INSPECT = Signal(int)                  # db_index
+    BUILDING_CHANGED = Signal(str, tuple)       # TABLE_NAME, db_indices
     ENCOUNTER_COMMIT = Signal(int)              # db_index
     ENCOUNTER_DELETE = Signal(int)              # db_index
     ENCOUNTER_INSPECT = Signal(int)             # db_index
@@ -40,6 +41,7 @@ class SignalManager(QObject):
     PRESENTER_BACKGROUND = Signal(int)          # db_index
     PRESENTER_REMOVE = Signal(int)              # db_index
     IMAGE_POPUP = Signal(int)                   # db_index
+    IMAGE_DECODED = Signal(int, int, object)    # db_index, size, QImage
     MUSIC_ADD = Signal(int, int)                # minstrel_db_index, treasure_db_index
     MUSIC_CONTINUE = Signal(int)                # minstrel_db_index
     MUSIC_DIRECT = Signal(int)                  # treasure_db_index
@@ -47,6 +49,7 @@ class SignalManager(QObject):
     CITADEL_SHOW = Signal()                     #
     CITADEL_LOADED = Signal()                   #
     REFRESH = Signal()
+    SAVE_STATE = Signal(str)                    # pending, flushed, failed
     PROGRESS_RANGE = Signal(int, int)           # min, max
     PROGRESS_SET = Signal(int)                  # step
 
@@ -77,7 +77,7 @@ class ImageContainer(QtWidgets.QLabel):
             return
         self.treasure = self.drop_object
         self.drop_object = None
-        self.image = self.treasure.to_image()
+        self.image = self.treasure.to_image(self.SIZE)
 
     @property
     def image(self):
@@ -134,7 +134,7 @@ class ImageContainer(QtWidgets.QLabel):
                 return
         self.treasure = treasure
         self.setWindowTitle(treasure['name'])
-        self.image = treasure.to_image()
+        self.image = treasure.to_image(self.SIZE)
 
     def update_image(self):
         if not self.image:
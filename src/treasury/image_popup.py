@@ -21,9 +21,11 @@ class ImagePopup(QtWidgets.QMainWindow):
         self.label.installEventFilter(self)
         self.setCentralWidget(self.label)
         self.resize_timer = QtCore.QTimer(self)
+        self.requested_size = 0
 
         SIGNALS.TREASURE_DELETE.connect(self.on_delete)
         SIGNALS.TREASURE_COMMIT.connect(self.on_commit)
+        SIGNALS.IMAGE_DECODED.connect(self.on_image_decoded)
 
         screen_size = QtWidgets.QApplication.primaryScreen().size()
         self.max_height = int(screen_size.height() * .8)
@@ -69,15 +71,26 @@ class ImagePopup(QtWidgets.QMainWindow):
             return
         self.deleteLater()
 
+    def on_image_decoded(self, db_index: int, size: int, image: QtGui.QImage):
+        if db_index == self.treasure.db_index and size == self.requested_size:
+            self.show_image(image)
+
     def resizeEvent(self, event: QtCore.QEvent.Resize):
         if event.oldSize() != event.size():
             self.resize_timer.singleShot(300, self.update_image)
 
-    def update_image(self):
-        image = self.treasure.to_image()
+    def show_image(self, image: QtGui.QImage):
         scaled_image = image.scaled(min(self.max_width, image.width(), self.width()),
                                     min(self.max_height * .8, image.height(), self.height()),
                                     QtGui.Qt.KeepAspectRatio)
         self.label.setPixmap(QtGui.QPixmap(scaled_image))
         self.resize(self.label.sizeHint())
-        self.setMaximumSize(image.size())
+
+    def update_image(self):
+        limner = self.treasure.keep.limner
+        self.requested_size = max(min(self.max_width, self.width()), min(int(self.max_height * .8), self.height()))
+        if (image := limner.request(self.treasure, self.requested_size)) is None:
+            image = limner.get_placeholder(self.treasure, self.requested_size)
+        self.show_image(image)
+        if (image_size := self.treasure.get_image_size()).isValid():
+            self.setMaximumSize(image_size)
@@ -47,7 +47,7 @@ class Downloader(BackgroundProcess):
         downloaded_filename = self.download_youtube()
         converted_path = self.convert_to_mp3(downloaded_filename)
         downloaded_path = Path(downloaded_filename)
-        uuid = Treasure.get_uuid_from_bytes(converted_path.read_bytes())
+        uuid = Treasure.get_uuid_from_path(converted_path)
         self.treasure['name'] = downloaded_path.stem
         self.treasure['type'] = 'music'
         self.treasure['suffix'] = '.mp3'
@@ -93,11 +93,10 @@ class Importer(QtCore.QObject):
         self.treasure = treasure
 
     def exec_(self) -> int:
-        df = self.treasure.keep.buildings['treasure'].df
-        duplicates = df[df['uuid'] == self.treasure.uuid]
-        if not duplicates.empty:
-            duplicate = duplicates.iloc[0]
-            duplicate_name = duplicate['name']
+        building = self.treasure.keep.buildings['treasure']
+        duplicates = building.get_index('uuid', self.treasure.uuid)
+        if duplicates:
+            duplicate_name = building.get_value(duplicates[0], 'name')
             duplicate_box = QtWidgets.QMessageBox()
             duplicate_box.setIcon(duplicate_box.Question)
             duplicate_box.setWindowTitle('Duplicate Found')
@@ -108,7 +107,7 @@ class Importer(QtCore.QObject):
             duplicate_box.addButton(no_button, duplicate_box.RejectRole)
             duplicate_box.exec_()
             if duplicate_box.clickedButton() == no_button:
-                self.treasure = Treasure.read_keep(self.treasure.keep, db_index=int(duplicate.name))
+                self.treasure = Treasure.read_keep(self.treasure.keep, db_index=duplicates[0])
                 return 0
         if self.treasure['suffix'] == 'URL:youtube' and self.convert_youtube:
             message_box = QtWidgets.QMessageBox()
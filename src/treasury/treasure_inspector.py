@@ -121,13 +121,12 @@ class TreasureInspector(QtWidgets.QMainWindow):
 
     def delete_inscriptions(self):
         inscription = self.treasure.keep.buildings['inscription']
-        df = inscription.df
-        df.drop(df[df['_treasure'] == self.treasure.db_index].index, inplace=True)
-        inscription.reset_columns()
-        inscription.save(False)
+        inscription.drop_where('_treasure', self.treasure.db_index)
+        inscription.save()
 
     def delete_treasure(self):
-        if DeleteDialog('Treasure', self).get() == 'cancel':
+        usage = self.treasure.find_usage() if self.treasure.is_used() else ''
+        if DeleteDialog('Treasure', self, usage).get() == 'cancel':
             return
         self.treasure.delete()
 
@@ -158,7 +157,7 @@ class TreasureInspector(QtWidgets.QMainWindow):
             self.close()
 
     def load_treasure(self):
-        image = self.treasure.to_image()
+        image = self.treasure.to_image(max(self.image_label.size().toTuple()))
         self.image_label.setPixmap(QtGui.QPixmap(image.scaled(self.image_label.size(), QtGui.Qt.KeepAspectRatio)))
         self.name_edit.setText(self.treasure['name'])
         self.info_edit.setText(self.treasure['info'])
@@ -166,8 +165,8 @@ class TreasureInspector(QtWidgets.QMainWindow):
         self.suffix_edit.setText(self.treasure['suffix'])
         self.size_edit.setText(str(self.treasure['size'] or '- external -'))
         self.uuid_edit.setText(self.treasure['uuid'] or '- external -')
-        self.modified_edit.setText(self.treasure['_modified'])
-        self.created_edit.setText(self.treasure['_created'])
+        self.modified_edit.setText(self.treasure.get_text('_modified'))
+        self.created_edit.setText(self.treasure.get_text('_created'))
         self.text_edit.set_html(self.treasure['text'])
         self.tag_frame.set_tags(self.treasure.get_tags())
         self.is_modified = False
@@ -216,8 +215,8 @@ class TreasureInspector(QtWidgets.QMainWindow):
 
     def reload_treasure(self):
         self.name_edit.setText(self.treasure['name'])
-        self.modified_edit.setText(self.treasure['_modified'])
-        self.created_edit.setText(self.treasure['_created'])
+        self.modified_edit.setText(self.treasure.get_text('_modified'))
+        self.created_edit.setText(self.treasure.get_text('_created'))
         self.is_modified = False
 
     def reload_window(self):
@@ -240,7 +239,7 @@ class TreasureInspector(QtWidgets.QMainWindow):
         db_index = self.treasure.db_index
         for tag_name in self.tag_frame.tags:
             Inscription(keep, data={'_treasure': db_index, 'name': tag_name}).commit()
-        keep.buildings['inscription'].save(False)
+        keep.buildings['inscription'].save()
 
     def set_modified(self, modified: bool = True):
         self.is_modified = modified
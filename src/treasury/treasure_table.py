@@ -1,11 +1,10 @@
 from collections import defaultdict
 
-import pandas as pd
 from PySide2 import QtCore, QtGui, QtWidgets
 
 from .import_tools import ClipboardAction, Importer, OpenTreasureDialog
 from .treasure_menu import TreasureMenu
-from src.model import Keep, Treasure
+from src.model import Feature, Keep, Treasure
 from src.settings import SIGNALS
 from src.widgets import Icon
 
@@ -19,15 +18,13 @@ class TreasureTable(BuildingTable):
     def __init__(self, keep: Keep, parent: QtWidgets.QWidget | None = None):
         super().__init__(keep=keep, feature_type=Treasure, parent=parent)
         self.drop_treasure = None
-        self.inscription_df = keep.buildings['inscription'].df
         self.row_num = None
         self.display_type: dict[str, bool] = defaultdict(lambda: True)
         self.search_black_list: tuple[str, ...] = ()
         self.search_white_list: tuple[str, ...] = ()
         self.viewport().setAcceptDrops(True)
 
-        self.reload_data()
-        self.refresh_hidden()
+        self.reload_header()
 
     def contextMenuEvent(self, event: QtGui.QContextMenuEvent):
         db_index = self.get_db_index(self.rowAt(event.pos().y()))
@@ -80,24 +77,23 @@ class TreasureTable(BuildingTable):
             self.SEARCH.emit()
         super().keyPressEvent(event)
 
-    def load_series(self, series: pd.Series, row: int | None = None):
+    def load_feature(self, feature: Feature, row: int | None = None):
         self.blockSignals(True)
         new_row = row is None
         if new_row:
             row = self.row_num
-        series = series.copy(False)
-        db_index = int(series.name)  # noqa
-        name_item = QtWidgets.QTableWidgetItem(series['name'])
+        db_index = feature.db_index
+        name_item = QtWidgets.QTableWidgetItem(feature['name'])
         name_item.setData(QtCore.Qt.UserRole, db_index)
         name_item.setFlags(name_item.flags() & ~QtCore.Qt.ItemIsEditable)
-        type_item = QtWidgets.QTableWidgetItem(Icon(Treasure.get_icon_name(series['type'])),
-                                               series['type'].capitalize())
+        type_item = QtWidgets.QTableWidgetItem(Icon(Treasure.get_icon_name(feature['type'])),
+                                               feature['type'].capitalize())
         type_item.setFlags(type_item.flags() & ~QtCore.Qt.ItemIsEditable)
         self.setItem(row, 0, name_item)
         self.setItem(row, 1, type_item)
 
         for column, (column_name, _) in enumerate(self.HEADERS[2:], start=2):
-            item = QtWidgets.QTableWidgetItem(str(series[column_name]))
+            item = QtWidgets.QTableWidgetItem(feature.get_text(column_name))
             item.setFlags(item.flags() & ~QtCore.Qt.ItemIsEditable)
             item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
             self.setItem(row, column, item)
@@ -116,15 +112,18 @@ class TreasureTable(BuildingTable):
         self.clear()
         self.setRowCount(len(self.df.index))
         self.row_num = 0
-        self.setColumnCount(len(self.HEADERS))
-        self.setHorizontalHeaderLabels(list(header[1] for header in self.HEADERS))
-        if not self.df.empty:
-            self.df.apply(self.load_series, axis=1)
+        self.reload_header()
+        for feature in self.building.read_many():
+            self.load_feature(feature)
         self.verticalHeader().setVisible(False)
         self.horizontalHeader().setMinimumSectionSize(20)
         self.resizeColumnsToContents()
         self.resizeRowsToContents()
 
+    def reload_header(self):
+        self.setColumnCount(len(self.HEADERS))
+        self.setHorizontalHeaderLabels(list(header[1] for header in self.HEADERS))
+
     def refresh_hidden(self):
         for row in range(self.rowCount()):
             search_string = self.item(row, 0).text().lower() + ', ' + self.item(row, 6).text().lower()
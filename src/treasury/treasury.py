@@ -32,28 +32,12 @@ class Treasury(BuildingWindow):
         self.table.SEARCH.connect(self.toolbar.search)
         self.set_settings(settings)
         SIGNALS.TREASURE_COMMIT.connect(lambda _: keep.buildings['treasure'].save())
-        SIGNALS.TREASURE_DELETE.connect(self.on_delete_treasure)
         SIGNALS.TREASURE_INSPECT.connect(self.on_inspect_treasure)
         SIGNALS.IMAGE_POPUP.connect(self.on_image_popup)
 
     def get_settings(self) -> dict:
         return {'hidden': tuple(self.table.isColumnHidden(column) for column in range(self.table.columnCount()))}
 
-    def on_delete_treasure(self, db_index):
-        for building_name in ('inscription', 'repertoire', 'chart'):
-            building = self.keep.buildings[building_name]
-            df = building.df
-            df.drop(df[df['_treasure'] == db_index].index, inplace=True)
-            building.reset_columns()
-            building.save(modified_only=False)
-        book = self.keep.buildings['book']
-        book.df.loc[book.df['_treasure'] == db_index, '_treasure'] = 0
-        guard = self.keep.buildings['guard']
-        guard.df.loc[guard.df['_treasure'] == db_index, '_treasure'] = 0
-        self.keep.buildings['guard'].save(False)
-        self.keep.buildings['book'].save(False)
-        self.keep.buildings['treasure'].save(False)
-
     def on_image_popup(self, db_index: int):
         for child in QtWidgets.QApplication.topLevelWidgets():
             if not isinstance(child, ImagePopup):
@@ -1,10 +1,11 @@
 from functools import partial
 from typing import Type
 
+import pandas as pd
 from PySide2 import QtCore, QtGui, QtWidgets
 
 from .delete_dialog import DeleteDialog
-from src.model import Feature, Keep
+from src.model import Building, Feature, Keep
 from src.settings import SIGNALS
 from .preview import Preview
 
@@ -17,10 +18,10 @@ class BuildingTable(QtWidgets.QTableWidget):
         self.keep = keep
 
         self.display_string = ''
-        self.df = keep.buildings[feature_type.TABLE_NAME].df
         self.drag = None
         self.feature_type = feature_type
         self.feature_preview = None
+        self.loaded = False
         self.horizontalHeader().setStretchLastSection(True)
         self.horizontalHeader().setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.horizontalHeader().customContextMenuRequested.connect(self.on_header_menu)
@@ -31,9 +32,19 @@ class BuildingTable(QtWidgets.QTableWidget):
         self.setSortingEnabled(True)
         self.viewport().installEventFilter(self)
         self.viewport().setMouseTracking(True)
+        self.version = 0
 
         SIGNALS.FEATURE_COMMIT.connect(self.on_feature_commit)
         SIGNALS.FEATURE_DELETE.connect(self.on_feature_delete)
+        SIGNALS.BUILDING_CHANGED.connect(self.on_building_changed)
+
+    @property
+    def building(self) -> Building:
+        return self.keep.buildings[self.feature_type.TABLE_NAME]
+
+    @property
+    def df(self) -> pd.DataFrame:
+        return self.building.df
 
     def eventFilter(self, source: QtCore.QObject, event: QtCore.QEvent) -> bool:
         if source == self.viewport():
@@ -79,6 +90,17 @@ class BuildingTable(QtWidgets.QTableWidget):
         if self.feature_preview:
             self.feature_preview.deleteLater()
 
+    def load_row(self, db_index: int, row: int | None):
+        try:
+            feature = self.feature_type.read_keep(self.keep, db_index)
+        except KeyError:
+            return
+        if row is None:
+            row = self.rowCount()
+            self.insertRow(row)
+        self.load_feature(feature, row)
+        self.resizeRowToContents(row)
+
     def mouseDoubleClickEvent(self, event: QtGui.QMouseEvent):
         if event.button() != QtGui.Qt.LeftButton:
             return
@@ -121,29 +143,22 @@ class BuildingTable(QtWidgets.QTableWidget):
     def mouseReleaseEvent(self, _):
         self.drag = None
 
+    def on_building_changed(self, table_name: str, _: tuple[int, ...]):
+        if table_name == self.feature_type.TABLE_NAME and self.isVisible():
+            self.sync()
+
     def on_delete(self, db_index: int):
         if DeleteDialog(self.feature_type.__name__, self).get() == 'cancel':
             return
         self.feature_type.read_keep(self.keep, db_index=db_index).delete()
 
-    def on_feature_commit(self, table_name: str, db_index: int):
-        if table_name != self.feature_type.TABLE_NAME:
-            return
-        row = self.get_row(db_index)
-        if row is None:
-            row = self.rowCount()
-            self.insertRow(row)
-        try:
-            self.load_series(self.df.loc[db_index], row)
-            self.resizeColumnsToContents()
-            self.resizeRowToContents(row)
-        except KeyError:
-            pass
+    def on_feature_commit(self, table_name: str, _: int):
+        if table_name == self.feature_type.TABLE_NAME and self.isVisible():
+            self.sync()
 
-    def on_feature_delete(self, table_name: str, db_index: int):
-        if table_name != self.feature_type.TABLE_NAME:
-            return
-        self.removeRow(self.get_row(db_index))
+    def on_feature_delete(self, table_name: str, _: int):
+        if table_name == self.feature_type.TABLE_NAME and self.isVisible():
+            self.sync()
 
     def on_header_menu(self, point: QtCore.QPoint):
         menu = QtWidgets.QMenu(self)
@@ -154,3 +169,29 @@ class BuildingTable(QtWidgets.QTableWidget):
             action.toggled.connect(partial(lambda i, state: self.setColumnHidden(i, not state), index))
             menu.addAction(action)
         menu.popup(self.mapToGlobal(point))
+
+    def showEvent(self, event: QtGui.QShowEvent):
+        super().showEvent(event)
+        self.sync()
+
+    def sync(self):
+        changes = self.building.changes_since(self.version) if self.loaded else None
+        self.loaded = True
+        self.version = self.building.version
+        if changes is None:
+            self.reload_data()
+            self.refresh_hidden()
+            return
+        if not changes:
+            return
+        actions = {change.db_index: change.action for change in changes}
+        rows = {self.get_db_index(row): row for row in range(self.rowCount())}
+        self.setSortingEnabled(False)
+        for db_index, action in actions.items():
+            if action != 'delete':
+                self.load_row(db_index, rows.get(db_index))
+        for row in sorted((rows[db_index] for db_index, action in actions.items()
+                           if action == 'delete' and db_index in rows), reverse=True):
+            self.removeRow(row)
+        self.setSortingEnabled(True)
+        self.resizeColumnsToContents()
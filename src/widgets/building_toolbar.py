@@ -1,7 +1,7 @@
 from functools import partial
 from typing import Type
 
-from PySide2 import QtCore, QtWidgets
+from PySide2 import QtCore, QtGui, QtWidgets
 
 from .icon import Icon
 from src.model import Feature, Keep
@@ -27,6 +27,7 @@ class BuildingToolbar(QtWidgets.QToolBar):
         super().__init__(parent=parent)
         self.feature_type = feature_type
         self.keep = keep
+        self.stale = False
 
         self.building_type_actions: dict[str, BuildingTypeAction] = {}
         self.hidden_button = QtWidgets.QToolButton(self)
@@ -48,7 +49,8 @@ class BuildingToolbar(QtWidgets.QToolBar):
             self.addWidget(QtWidgets.QLabel(' Filter Types: '))
             SIGNALS.FEATURE_COMMIT.connect(self.on_feature_commit)
             SIGNALS.FEATURE_DELETE.connect(self.on_feature_commit)
-            self.on_feature_commit(self.feature_type.TABLE_NAME)
+            SIGNALS.BUILDING_CHANGED.connect(self.on_feature_commit)
+            self.stale = True
 
         self.addSeparator()
         self.addWidget(self.hidden_button)
@@ -79,11 +81,9 @@ class BuildingToolbar(QtWidgets.QToolBar):
     def on_feature_commit(self, table_name: str, _: int = None):
         if table_name != self.feature_type.TABLE_NAME:
             return
-        completer = QtWidgets.QCompleter(
-            self.keep.buildings[self.feature_type.TAG_TABLE_NAME].df['name'].unique().tolist())
-        completer.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
-        self.reload_feature_types()
-        self.search_edit.setCompleter(completer)
+        self.stale = True
+        if self.isVisible():
+            self.reload()
 
     def on_search_string_changed(self, _: str):
         self.timer.start(self.TIMER_SECONDS)
@@ -91,6 +91,14 @@ class BuildingToolbar(QtWidgets.QToolBar):
     def on_toggle(self, action: BuildingTypeAction, state: bool):
         self.STATE.emit(state, action.type_)
 
+    def reload(self):
+        self.stale = False
+        completer = QtWidgets.QCompleter(
+            self.keep.buildings[self.feature_type.TAG_TABLE_NAME].df['name'].unique().tolist())
+        completer.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self.reload_feature_types()
+        self.search_edit.setCompleter(completer)
+
     def reload_feature_types(self):
         type_list = self.keep.buildings[self.feature_type.TABLE_NAME].df['type'].unique()
         for type_name in type_list:
@@ -109,3 +117,8 @@ class BuildingToolbar(QtWidgets.QToolBar):
     def search(self):
         self.search_edit.setFocus()
         self.search_edit.setSelection(0, len(self.search_edit.text()))
+
+    def showEvent(self, event: QtGui.QShowEvent):
+        super().showEvent(event)
+        if self.stale:
+            self.reload()
@@ -5,10 +5,12 @@ from .icon import Icon
 
 class DeleteDialog(QtWidgets.QMessageBox):
 
-    def __init__(self, feature_name: str, parent: QtWidgets.QWidget | None = None):
+    def __init__(self, feature_name: str, parent: QtWidgets.QWidget | None = None, usage: str = ''):
         super().__init__(parent)
         self.setStyleSheet('*{font-family: Roboto Slab; font-size: 10pt};')
         self.setText(f'Are you sure you want to permanently remove this {feature_name}?')
+        if usage:
+            self.setInformativeText(usage)
         self.setWindowTitle(f'Remove {feature_name}')
         self.setIcon(QtWidgets.QMessageBox.Warning)
         self.setWindowIcon(Icon('garbage_can'))
@@ -65,7 +65,7 @@ class Preview(QtWidgets.QMainWindow):
                     stat_block.update()
                     self._image = stat_block.to_pixmap()
                 case _:
-                    self._image = self._feature.to_image()
+                    self._image = self._feature.to_image(max(self.SIZE))
                     if self._image.width() > self.SIZE[0] or self._image.height() > self.SIZE[1]:
                         self._image = self._image.scaled(*self.SIZE, QtGui.Qt.KeepAspectRatio)
                     self.label.setFixedSize(self._image.size())
@@ -123,6 +123,7 @@ class TagEdit(QtWidgets.QWidget):
     def __init__(self, tag_name: str = 'Tag', building: Building = None, parent: QtWidgets.QWidget | None = None):
         super().__init__(parent)
         self.building = building
+        self.stale = True
         self.table_name = building.feature_type.TABLE_NAME
         self.validator = self.Validator()
         self.add_button = QtWidgets.QPushButton(Icon('plus'), '', self)
@@ -143,13 +144,19 @@ class TagEdit(QtWidgets.QWidget):
         self.text_edit.returnPressed.connect(self.submit)
         self.add_button.clicked.connect(self.submit)
         self.reload_validation()
-        self.reload_completer(self.table_name)
-        SIGNALS.FEATURE_COMMIT.connect(self.reload_completer)
-        SIGNALS.FEATURE_DELETE.connect(self.reload_completer)
+        SIGNALS.FEATURE_COMMIT.connect(self.on_building_changed)
+        SIGNALS.FEATURE_DELETE.connect(self.on_building_changed)
+        SIGNALS.BUILDING_CHANGED.connect(self.on_building_changed)
 
-    def reload_completer(self, table_name: str, _: int = None):
+    def on_building_changed(self, table_name: str, _: int = None):
         if table_name != self.table_name:
             return
+        self.stale = True
+        if self.isVisible():
+            self.reload_completer()
+
+    def reload_completer(self):
+        self.stale = False
         completer = QtWidgets.QCompleter(self.building.df['name'].unique().tolist())
         completer.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
         self.text_edit.setCompleter(completer)
@@ -157,6 +164,11 @@ class TagEdit(QtWidgets.QWidget):
     def reload_validation(self):
         self.add_button.setEnabled(self.text_edit.hasAcceptableInput())
 
+    def showEvent(self, event: QtGui.QShowEvent):
+        super().showEvent(event)
+        if self.stale:
+            self.reload_completer()
+
     def submit(self):
         if not self.text_edit.hasAcceptableInput():
             return